@@ -15,10 +15,20 @@ License: MIT
 """
 
 import os
+import sys
 import logging
 import time
+import re
+import random
+import operator
 import asyncio
-from typing import Dict, Optional, List, Collection, NamedTuple
+import functools
+import hashlib
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import ClassVar, Dict, Optional, List, Collection, Iterator, NamedTuple
 from dagster_cloud.workspace.user_code_launcher import DagsterCloudUserCodeLauncher
 from dagster_cloud.workspace.user_code_launcher.user_code_launcher import (
     DagsterCloudGrpcServer,
@@ -27,9 +37,24 @@ from dagster_cloud.workspace.user_code_launcher.user_code_launcher import (
 )
 from dagster_cloud.api.dagster_cloud_api import UserCodeDeploymentType
 from dagster_cloud.execution.monitoring import CloudContainerResourceLimits
+from dagster import check
 from dagster._core.launcher import RunLauncher
-from azure.identity import DefaultAzureCredential
+from dagster._grpc.types import ExecuteRunArgs
+import requests
+from requests.adapters import HTTPAdapter
+from azure.core.credentials import AccessToken
+from azure.core.exceptions import (
+    HttpResponseError,
+    ResourceNotFoundError,
+    ServiceRequestError,
+    ServiceResponseError,
+)
+from azure.core.pipeline.transport import RequestsTransport
+from azure.core.polling import LROPoller
+from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
 from azure.mgmt.appcontainers import ContainerAppsAPIClient
+from azure.mgmt.appcontainers.aio import ContainerAppsAPIClient as AioContainerAppsAPIClient
+from azure.mgmt.core.polling.arm_polling import ARMPolling
 from azure.mgmt.appcontainers.models import (
     ContainerApp,
     Container,
@@ -43,6 +68,7 @@ from azure.mgmt.appcontainers.models import (
     ContainerResources,
     ContainerAppProbe,
     ContainerAppProbeHttpGet,
+    ContainerAppProbeTcpSocket,
     RegistryCredentials,
     ManagedServiceIdentity,
     UserAssignedIdentity,
@@ -50,6 +76,490 @@ from azure.mgmt.appcontainers.models import (
 
 logger = logging.getLogger(__name__)
 
+# ARM clients are cached per subscription so that re-instantiated launchers
+# (reconciler restarts, run launchers) reuse the same HTTP connection pool
+# instead of redoing the TCP/TLS handshake on their first ARM call.
+_ACA_CLIENT_CACHE: Dict[str, ContainerAppsAPIClient] = {}
+_ACA_CLIENT_LOCK = threading.Lock()
+
+# Token-caching credential shared by every cached client, created on first use
+_CREDENTIAL: Optional["_CachingCredential"] = None
+
+# Keep-alive connections pooled per ARM host by the cached clients' transport
+_ARM_POOL_CONNECTIONS = 4
+_ARM_POOL_MAXSIZE = 32
+
+# Refresh cached tokens this many seconds before they expire
+_TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+# Short-lived cache of container_apps.get results, keyed by (subscription, resource group,
+# app name), so bursts of reads during a reconcile tick collapse into one ARM call
+_APP_CACHE: Dict[tuple, tuple] = {}
+_APP_CACHE_LOCK = threading.Lock()
+_APP_CACHE_TTL_SECONDS = 2.0
+_APP_CACHE_MAX_SIZE = 1024
+
+# How long a listing of managed apps is shared between reconcile consumers
+_LIST_CACHE_TTL_SECONDS = 5.0
+
+# Per-call retry settings for reads on the run launch path: a failed lookup is fatal to the
+# launch anyway, so fail within seconds and let Dagster retry rather than back off for ~60s
+_FAST_READ_RETRY = {"retry_total": 1, "retry_backoff_factor": 0.3, "retry_backoff_max": 2}
+
+# How long a run launcher reuses a code server's image and env vars across run launches
+_CODE_SERVER_SPEC_TTL_SECONDS = 60.0
+
+# Tag keys read from every managed app during reconciliation (interned for fast dict hashing)
+_TAG_MANAGED_BY, _TAG_DEP, _TAG_LOC, _TAG_AGENT, _TAG_TS = map(
+    sys.intern,
+    ("managed-by", "dagster-deployment", "dagster-location", "dagster-agent-id", "dagster-update-timestamp")
+)
+_MANAGED_BY_VALUE = "dagster-cloud-agent"
+
+# Registry host suffixes for Azure Container Registry and AWS ECR login servers
+_ACR_SUFFIX = ".azurecr.io"
+_AWS_SUFFIX = ".amazonaws.com"
+
+# Separators mapped to hyphens, then anything else ACA rejects in an app name is dropped
+_ACA_NAME_TABLE = str.maketrans({"_": "-", ".": "-", " ": "-"})
+_ACA_NAME_STRIP = re.compile(r"[^a-z0-9-]").sub
+_ACA_NAME_MAX_LENGTH = 32
+
+# Attribute paths resolved on every run launch, compiled once
+_INSTANCE_DEPLOYMENT_GETTER = operator.attrgetter("_instance.deployment_name")
+_LOCATION_NAME_GETTER = operator.attrgetter(
+    "remote_job_origin.repository_origin.code_location_origin.location_name"
+)
+_JOB_NAME_GETTER = operator.attrgetter("remote_job_origin.job_name")
+
+# Container App provisioning/running states checked while waiting for readiness
+_SUCCEEDED = "Succeeded"
+_RUNNING = "Running"
+_FAILED = "Failed"
+# States an app won't recover from on its own - waiting any longer is pointless
+_TERMINAL_PROVISIONING_STATES = frozenset({_FAILED, "Canceled"})
+_TERMINAL_RUNNING_STATES = frozenset({_FAILED, "Degraded"})
+
+# Readiness wait: overall deadline, and full-jitter exponential backoff between polls
+# (base * 2**attempt, capped) so concurrent launches don't poll ARM in lockstep
+_SERVER_READY_TIMEOUT_SECONDS = 300.0
+_READY_BACKOFF_BASE_SECONDS = 1.0
+_READY_BACKOFF_CAP_SECONDS = 10.0
+
+# Upper bound on a tick's per-app status GETs, so a stalled connection is abandoned and
+# retried on the next tick instead of stretching the tick to the SDK socket timeout
+_STATUS_CALL_TIMEOUT_SECONDS = 8.0
+
+# Pending apps at which a tick lists the whole resource group instead of one GET per app.
+# Run workers share the resource group, so the list costs more as they accumulate.
+_STATUS_LIST_MIN_APPS = 3
+
+# gRPC health check retries made against a running app between ARM status re-checks
+_GRPC_RETRIES_PER_STATUS_CHECK = 3
+
+# Longest wait between ARM long-running-operation status polls. ARM's Retry-After for
+# Container Apps is often far longer than the operation itself, so it is capped at this
+_LRO_POLLING_INTERVAL = int(os.getenv("ACA_LRO_POLL_SEC", "5"))
+
+
+# Code servers always run exactly one replica with no scale rules. Shared across
+# envelopes - it is only ever serialized, never mutated.
+_CODE_SERVER_SCALE = Scale(min_replicas=1, max_replicas=1, rules=[])
+
+# Tags applied to every code server Container App (merged with policy-required tags)
+_CODE_SERVER_BASE_TAGS = {
+    "dagster-component": "code-server",
+    "managed-by": "dagster-cloud-agent",
+}
+
+# gRPC port served by Dagster code servers
+_CODE_SERVER_PORT = 4000
+
+# ACA only routes to a code server replica once its gRPC port accepts connections. A
+# readiness probe (not a startup probe) so slow-loading definitions never get the
+# container restarted. Attached only to envelopes with gRPC ingress; shared across them
+# since it is only ever serialized.
+_CODE_SERVER_PROBES = [
+    ContainerAppProbe(
+        type="Readiness",
+        tcp_socket=ContainerAppProbeTcpSocket(port=_CODE_SERVER_PORT),
+        initial_delay_seconds=2,
+        period_seconds=2,
+    )
+]
+
+# Every redeploy of a code server leaves its previous revision behind as inactive. ACA
+# keeps up to 100 by default, and the revision list endpoints slow down (and eventually
+# time out) as they pile up, so ask ACA to prune all but the newest few itself.
+_CODE_SERVER_MAX_INACTIVE_REVISIONS = 5
+
+# DAGSTER_CLOUD_URL is fixed for the agent's lifetime (set before the launcher is imported),
+# so its EnvironmentVar is built once and shared by every code server envelope
+_ENV_NAME_DEP, _ENV_NAME_LOC, _ENV_NAME_URL = map(
+    sys.intern,
+    ("DAGSTER_CLOUD_DEPLOYMENT_NAME", "DAGSTER_CLOUD_CODE_LOCATION_NAME", "DAGSTER_CLOUD_URL")
+)
+_DAGSTER_CLOUD_URL = os.getenv(_ENV_NAME_URL, "https://dagster.cloud")
+_BASE_ENV_VAR_URL = EnvironmentVar(name=_ENV_NAME_URL, value=_DAGSTER_CLOUD_URL)
+
+
+class _CappedARMPolling(ARMPolling):
+    """
+    ARMPolling that follows Retry-After only up to its polling interval.
+
+    ARMPolling waits for Retry-After whenever ARM sends it and only falls back to the
+    polling interval without it, so the interval alone never shortens the wait. Every
+    delay is jittered so simultaneous launches don't poll in lockstep.
+    """
+
+    def _extract_delay(self) -> float:
+        return min(super()._extract_delay(), self._timeout) + random.random()
+
+
+def _lro_polling() -> _CappedARMPolling:
+    """Polling method for one LRO (polling methods hold per-operation state)."""
+    return _CappedARMPolling(_LRO_POLLING_INTERVAL)
+
+
+def _backoff_schedule(
+    base: float = _READY_BACKOFF_BASE_SECONDS,
+    cap: float = _READY_BACKOFF_CAP_SECONDS,
+    deadline: Optional[float] = None,
+) -> Iterator[float]:
+    """
+    Yield full-jitter exponential backoff delays: early delays catch fast starts,
+    later ones spread out up to cap.
+
+    Args:
+        base: Upper bound of the first delay, in seconds
+        cap: Largest upper bound for any delay, in seconds
+        deadline: Optional time.monotonic() value after which the schedule stops
+    """
+    rnd = random.random
+    k = 0
+    while deadline is None or time.monotonic() < deadline:
+        yield rnd() * min(cap, base * (1 << min(k, 10)))
+        k += 1
+
+
+def _view(tags: Dict[str, str]) -> tuple:
+    """
+    Read the Dagster tags of a Container App in one pass.
+
+    Returns:
+        Tuple of (managed_by, deployment, location, agent_id, update_timestamp) tag values
+    """
+    get = tags.get
+    return get(_TAG_MANAGED_BY), get(_TAG_DEP), get(_TAG_LOC), get(_TAG_AGENT), get(_TAG_TS)
+
+
+@dataclass(slots=True, frozen=True)
+class _AppStatus:
+    """Status fields of a Container App, read once per fetch."""
+    provisioning_state: Optional[str]
+    running_status: str
+    latest_revision_name: Optional[str]
+
+
+def _snapshot(app: ContainerApp) -> _AppStatus:
+    """Capture the status fields of a fetched Container App."""
+    return _AppStatus(
+        provisioning_state=app.provisioning_state,
+        running_status=getattr(app, "running_status", None) or "Unknown",
+        latest_revision_name=app.latest_revision_name,
+    )
+
+
+async def _await_poller(poller: LROPoller, timeout: float):
+    """
+    Await an LRO poller's result without parking a worker thread on it.
+
+    The poller already polls on its own thread; its done callback resolves an asyncio
+    future, so cancelling or timing out the wait returns immediately and leaves the
+    operation running in ARM.
+    """
+    loop = asyncio.get_running_loop()
+    done = loop.create_future()
+
+    def _on_done(_polling_method) -> None:
+        try:
+            loop.call_soon_threadsafe(lambda: done.done() or done.set_result(None))
+        except RuntimeError:
+            # The waiting loop has since closed - nobody is left to notify
+            pass
+
+    poller.add_done_callback(_on_done)
+    # A callback added while the operation is finishing can be dropped, so check directly
+    # (the guard in _on_done keeps the result from being set twice)
+    if poller.done() and not done.done():
+        done.set_result(None)
+    await asyncio.wait_for(done, timeout=timeout)
+    return poller.result(timeout=0)
+
+
+def _sanitize_app_name(name: str) -> str:
+    """
+    Make a name valid for ACA: lowercase alphanumeric and hyphens, max 32 chars,
+    no trailing hyphen.
+
+    Names that are too long keep a prefix plus a short hash of the full name, so that
+    locations sharing a long prefix don't truncate to the same app.
+    """
+    name = _ACA_NAME_STRIP("", name.lower().translate(_ACA_NAME_TABLE))
+    if len(name) > _ACA_NAME_MAX_LENGTH:
+        digest = hashlib.blake2b(name.encode(), digest_size=4).hexdigest()
+        name = f"{name[:_ACA_NAME_MAX_LENGTH - len(digest) - 1].rstrip('-')}-{digest}"
+    return name.rstrip("-")
+
+
+@functools.lru_cache(maxsize=1024)
+def _app_name_for(deployment_name: str, location_name: str) -> str:
+    """
+    Return the Container App name for a code location's server.
+
+    Format: dagster-{deployment}-{location}, sanitized for ACA naming rules.
+    """
+    return _sanitize_app_name(f"dagster-{deployment_name}-{location_name}")
+
+
+def _legacy_app_name_for(deployment_name: str, location_name: str) -> str:
+    """
+    Return the name code servers were deployed under before names were sanitized.
+
+    Format: dagster-{deployment}-{location} cut to 32 chars. Servers deployed under it are
+    still adopted by tag during reconciliation, so run launches fall back to it.
+    """
+    return f"dagster-{deployment_name}-{location_name}"[:32].lower().replace("_", "-")
+
+
+@functools.lru_cache(maxsize=256)
+def _registry_credentials_for(registry_server: Optional[str], identity_id: Optional[str]) -> tuple:
+    """
+    Build the registry configuration for pulling from a registry server, memoized per server.
+
+    Images are redeployed with new tags far more often than they move registries, so the
+    validation and RegistryCredentials construction only happen once per registry.
+
+    Args:
+        registry_server: Registry host from the image URL, or None for Docker Hub images
+        identity_id: Resource ID of the code server managed identity, if configured
+
+    Returns:
+        Tuple of (secrets tuple, registries tuple) for Container App configuration
+    """
+    if not registry_server:
+        # No registry specified (e.g., "ubuntu:latest") - use Docker Hub public
+        return (), ()
+
+    # Check if this is Azure Container Registry (ACR)
+    if registry_server.endswith(_ACR_SUFFIX):
+        logger.info("Using Azure Container Registry %s with managed identity", registry_server)
+        # ACR with managed identity - configure registry to use the managed identity
+        # The Container App's managed identity must have AcrPull role on the ACR
+        if not identity_id:
+            raise ValueError(
+                "CODE_SERVER_IDENTITY_ID environment variable not set. "
+                "Managed identity is required for ACR authentication."
+            )
+
+        registries = (
+            RegistryCredentials(
+                server=registry_server,
+                identity=identity_id  # Use managed identity for authentication
+            ),
+        )
+        return (), registries
+
+    # Check if this is AWS ECR (serverless mode - not supported for hybrid)
+    if registry_server.endswith(_AWS_SUFFIX) and '.ecr.' in registry_server:
+        raise ValueError(
+            f"Code location uses AWS ECR image ({registry_server}). "
+            "This indicates the code location is configured for Dagster Cloud Serverless mode. "
+            "For hybrid deployments with Azure Container Apps, please:\n"
+            "1. Build and push your code location image to Azure Container Registry (ACR)\n"
+            "2. Update the code location in Dagster Cloud to use the ACR image\n"
+            "3. Grant the agent's managed identity 'AcrPull' role on your ACR"
+        )
+
+    # Other registries not supported
+    raise ValueError(
+        f"Unsupported container registry: {registry_server}. "
+        "Azure Container Apps hybrid agent only supports Azure Container Registry (ACR). "
+        "Please push your image to ACR and update your code location configuration."
+    )
+
+
+def _stripped_repository_origin(repository_origin):
+    """
+    Prepare a repository origin for a run worker's command line.
+
+    Strips the container context to reduce payload size, and points entry_point at
+    executable_path with python -m dagster. This handles the case where entry_point is
+    just ["dagster"] but dagster is installed in a virtualenv and not in the system PATH.
+    """
+    stripped_repository_origin = repository_origin._replace(container_context={})
+
+    executable_path = repository_origin.executable_path
+    if executable_path:
+        # Use the Python executable with -m flag to invoke dagster module
+        fixed_entry_point = [executable_path, "-m", "dagster"]
+        stripped_repository_origin = stripped_repository_origin._replace(entry_point=fixed_entry_point)
+        logger.info("Using entry point from executable_path: %s", fixed_entry_point)
+
+    return stripped_repository_origin
+
+
+def _environment_id_for(subscription_id: str, resource_group: str, environment_name: str) -> str:
+    """Return the ARM resource ID of a Container Apps managed environment."""
+    return (
+        f"/subscriptions/{subscription_id}"
+        f"/resourceGroups/{resource_group}"
+        f"/providers/Microsoft.App/managedEnvironments/{environment_name}"
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _location_env_vars(deployment_name: str, location_name: str) -> tuple:
+    """Return the deployment and location EnvironmentVars for a code location's server."""
+    return (
+        EnvironmentVar(name=_ENV_NAME_DEP, value=deployment_name),
+        EnvironmentVar(name=_ENV_NAME_LOC, value=location_name),
+    )
+
+
+def _run_app_name_for(run_id: str) -> str:
+    """Return the Container App name for a run's worker: dagster-run-{first 8 chars of run id}."""
+    return _sanitize_app_name(f"dagster-run-{run_id[:8]}")
+
+
+class _CachingCredential:
+    """
+    TokenCredential wrapper that caches access tokens per scope.
+
+    DefaultAzureCredential does not memoize tokens for every credential in its
+    chain (e.g. Azure CLI, IMDS), so each ARM call could otherwise pay for a
+    token round-trip. Tokens are reused until shortly before they expire.
+    """
+
+    def __init__(self, credential):
+        self._credential = credential
+        self._tokens: Dict[tuple, AccessToken] = {}
+        # Guards the token and lock maps only; refreshes hold just their scope's lock
+        self._lock = threading.Lock()
+        self._scope_locks: Dict[tuple, threading.Lock] = {}
+
+    def _cached_token(self, scopes: tuple) -> Optional[AccessToken]:
+        with self._lock:
+            token = self._tokens.get(scopes)
+        if token is not None and token.expires_on - time.time() > _TOKEN_REFRESH_MARGIN_SECONDS:
+            return token
+        return None
+
+    def get_token(self, *scopes: str, **kwargs) -> AccessToken:
+        # Tokens requested with claims or a specific tenant are not cacheable by scope alone
+        if kwargs.get("claims") or kwargs.get("tenant_id"):
+            return self._credential.get_token(*scopes, **kwargs)
+
+        token = self._cached_token(scopes)
+        if token is not None:
+            return token
+
+        with self._lock:
+            scope_lock = self._scope_locks.setdefault(scopes, threading.Lock())
+        # One refresh per scope at a time; other scopes are not held up by this round-trip
+        with scope_lock:
+            token = self._cached_token(scopes)
+            if token is None:
+                token = self._credential.get_token(*scopes, **kwargs)
+                with self._lock:
+                    self._tokens[scopes] = token
+            return token
+
+    def close(self) -> None:
+        self._credential.close()
+
+
+class _AioCredential:
+    """
+    Async view of the shared caching credential.
+
+    Lets aio clients reuse the process-wide token cache instead of building (and probing)
+    a fresh async DefaultAzureCredential for every batch of operations.
+    """
+
+    def __init__(self, credential: "_CachingCredential"):
+        self._credential = credential
+
+    async def get_token(self, *scopes: str, **kwargs) -> AccessToken:
+        return await asyncio.to_thread(self._credential.get_token, *scopes, **kwargs)
+
+    async def close(self) -> None:
+        # The shared credential outlives any one aio client
+        pass
+
+    async def __aenter__(self) -> "_AioCredential":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+
+def _make_credential():
+    """
+    Create the Azure credential for ARM calls.
+
+    Inside Azure Container Apps (CONTAINER_APP_NAME is set by the platform) only the
+    managed identity can work, so it is used directly instead of letting
+    DefaultAzureCredential probe every source in its chain first. Elsewhere (local
+    runs), DefaultAzureCredential is kept minus the interactive and IDE sources.
+    """
+    if os.getenv("CONTAINER_APP_NAME"):
+        return ManagedIdentityCredential(client_id=os.getenv("AZURE_CLIENT_ID"))
+    return DefaultAzureCredential(
+        exclude_interactive_browser_credential=True,
+        exclude_visual_studio_code_credential=True,
+        exclude_powershell_credential=True,
+    )
+
+
+def _get_credential() -> "_CachingCredential":
+    """Return the process-wide token-caching Azure credential, creating it on first use."""
+    global _CREDENTIAL
+    with _ACA_CLIENT_LOCK:
+        if _CREDENTIAL is None:
+            _CREDENTIAL = _CachingCredential(_make_credential())
+        return _CREDENTIAL
+
+
+def _make_arm_transport() -> RequestsTransport:
+    """
+    Build the HTTP transport for a cached ARM client.
+
+    requests' default pool keeps 10 connections per host; the launcher's concurrent
+    ARM calls (run launches, bulk reads) would otherwise open and tear down extra
+    TLS connections to management.azure.com beyond that.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_ARM_POOL_CONNECTIONS, pool_maxsize=_ARM_POOL_MAXSIZE
+    )
+    session.mount("https://", adapter)
+    return RequestsTransport(session=session, session_owner=False)
+
+
+def _get_or_create_aca_client(credential, subscription_id: str) -> ContainerAppsAPIClient:
+    """Return the cached ContainerAppsAPIClient for a subscription, creating it on a miss."""
+    with _ACA_CLIENT_LOCK:
+        client = _ACA_CLIENT_CACHE.get(subscription_id)
+        if client is None:
+            client = ContainerAppsAPIClient(
+                credential=credential,
+                subscription_id=subscription_id,
+                transport=_make_arm_transport()
+            )
+            _ACA_CLIENT_CACHE[subscription_id] = client
+        return client
+
 
 class AcaRunLauncher(RunLauncher):
     """
@@ -73,24 +583,161 @@ class AcaRunLauncher(RunLauncher):
         # Required tags for Azure policy
         self.required_tags = {"Department": os.getenv("AZURE_TAG_DEPARTMENT", "Engineering")}
 
-        # Initialize Azure client
-        credential = DefaultAzureCredential()
-        self.aca_client = ContainerAppsAPIClient(credential, self.subscription_id)
+        # Initialize Azure client (shared with the code launcher for this subscription)
+        self.aca_client = _get_or_create_aca_client(_get_credential(), self.subscription_id)
 
-        # Get environment resource ID
-        env = self.aca_client.managed_environments.get(
-            resource_group_name=self.resource_group,
-            environment_name=self.environment_name
-        )
-        self.environment_id = env.id
+        # Environment resource ID - deterministic, so no ARM call is needed to build it.
+        # Set ACA_VERIFY_ENV=1 to check that the environment exists at startup.
+        if os.getenv("ACA_VERIFY_ENV") == "1":
+            self.environment_id = self.aca_client.managed_environments.get(
+                resource_group_name=self.resource_group,
+                environment_name=self.environment_name
+            ).id
+        else:
+            self.environment_id = _environment_id_for(
+                self.subscription_id, self.resource_group, self.environment_name
+            )
 
-        logger.info(f"AcaRunLauncher initialized: rg={self.resource_group}, env={self.environment_name}")
+        # Parts of the run envelope that are the same for every run, built once and
+        # shared (they are only ever serialized, never mutated)
+        self._run_identity = ManagedServiceIdentity(
+            type="UserAssigned",
+            user_assigned_identities={self.code_server_identity_id: UserAssignedIdentity()}
+        ) if self.code_server_identity_id else None
+        self._run_resources = ContainerResources(cpu=0.5, memory="1.0Gi")
+        # Scale to 0 when done
+        self._run_scale = Scale(min_replicas=0, max_replicas=1, rules=[])
+        self._run_base_tags = {
+            **self.required_tags,
+            "dagster-component": "run-worker",
+            "managed-by": "dagster-cloud-agent",
+        }
+        # Run app Configuration by registry server (None when not pulling from ACR)
+        self._run_configurations: Dict[Optional[str], Configuration] = {}
+
+        # The instance's InstanceRef, resolved on first launch (the instance is attached
+        # after construction) and reused for every run
+        self._instance_ref = None
+
+        # Worker threads for overlapping the code server lookup with building the run command.
+        # Created on first use, and again after dispose() - the launcher itself may be reused.
+        self._spec_pool: Optional[ThreadPoolExecutor] = None
+        self._spec_pool_lock = threading.Lock()
+
+        # Code server image and env vars by app name, so bursts of runs share one GET
+        self._code_server_specs: Dict[str, tuple] = {}
+        self._code_server_specs_lock = threading.Lock()
+
+        logger.info("AcaRunLauncher initialized: rg=%s, env=%s", self.resource_group, self.environment_name)
+
+    def dispose(self):
+        """Release the launcher's worker threads when the instance shuts down."""
+        with self._spec_pool_lock:
+            pool, self._spec_pool = self._spec_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def _get_spec_pool(self) -> ThreadPoolExecutor:
+        """Return the code server lookup pool, creating it on first use (or after dispose)."""
+        with self._spec_pool_lock:
+            if self._spec_pool is None:
+                self._spec_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="aca-run-launch")
+            return self._spec_pool
 
     @property
     def supports_check_run_worker_health(self) -> bool:
         """Whether this launcher supports checking run worker health."""
         return False
 
+    def _get_code_server_spec(self, code_server_name: str) -> tuple:
+        """
+        Return a code server's image and the env vars runs inherit from it.
+
+        Cached for a short time so bursts of run launches share one ARM GET. (The Container
+        Apps GET has no $select projection, so the full app is fetched; the cache is what
+        keeps that off most launches.)
+
+        Returns:
+            Tuple of (container image, tuple of EnvironmentVar)
+        """
+        with self._code_server_specs_lock:
+            cached = self._code_server_specs.get(code_server_name)
+        if cached is not None and time.monotonic() - cached[0] < _CODE_SERVER_SPEC_TTL_SECONDS:
+            return cached[1], cached[2]
+
+        code_server_app = self.aca_client.container_apps.get(
+            resource_group_name=self.resource_group,
+            container_app_name=code_server_name,
+            **_FAST_READ_RETRY
+        )
+        container = code_server_app.template.containers[0]
+        # Don't copy DAGSTER_CLOUD_CODE_LOCATION_NAME as it's not needed for runs
+        # Filtered once here and shared by every run launched from this code server
+        env = tuple(env_var for env_var in container.env or () if env_var.name != _ENV_NAME_LOC)
+
+        with self._code_server_specs_lock:
+            self._code_server_specs[code_server_name] = (time.monotonic(), container.image, env)
+        return container.image, env
+
+    def _find_code_server_spec(self, deployment_name: str, location_name: str) -> tuple:
+        """
+        Return a location's code server name, image and inherited env vars.
+
+        Falls back to the legacy app name when no app exists under the current one, so
+        code servers deployed before names were sanitized keep serving runs.
+
+        Returns:
+            Tuple of (Container App name, container image, tuple of EnvironmentVar)
+        """
+        code_server_name = _app_name_for(deployment_name, location_name)
+        try:
+            return (code_server_name, *self._get_code_server_spec(code_server_name))
+        except ResourceNotFoundError:
+            legacy_name = _legacy_app_name_for(deployment_name, location_name)
+            if legacy_name == code_server_name:
+                raise
+            logger.info("Code server %s not found, trying legacy name %s", code_server_name, legacy_name)
+            return (legacy_name, *self._get_code_server_spec(legacy_name))
+
+    def _get_instance_ref(self):
+        """Get the instance's InstanceRef, building it on first use."""
+        if self._instance_ref is None:
+            self._instance_ref = self._instance.get_ref()
+        return self._instance_ref
+
+    def _get_run_configuration(self, registry_server: Optional[str]) -> Configuration:
+        """
+        Return the shared run app Configuration for a registry server, building it on first use.
+
+        Args:
+            registry_server: ACR login server to pull the run image with, or None
+        """
+        configuration = self._run_configurations.get(registry_server)
+        if configuration is None:
+            registries = None
+            if registry_server:
+                logger.info("Configuring ACR access for runs: %s", registry_server)
+                registries = [
+                    RegistryCredentials(
+                        server=registry_server,
+                        identity=self.code_server_identity_id
+                    )
+                ]
+            configuration = Configuration(
+                # No ingress - runs don't need external access
+                ingress=None,
+                secrets=[],
+                registries=registries,
+                active_revisions_mode="Single",
+            )
+            self._run_configurations[registry_server] = configuration
+        return configuration
+
+    def _invalidate_code_server_spec(self, code_server_name: str) -> None:
+        """Drop a code server's cached image and env vars after it changed or a launch failed."""
+        with self._code_server_specs_lock:
+            self._code_server_specs.pop(code_server_name, None)
+
     def launch_run(self, context):
         """
         Launch a Dagster run in a new Container App instance.
@@ -100,14 +747,10 @@ class AcaRunLauncher(RunLauncher):
         - Scales down to 0 after completion
         - Has no ingress (no external access needed)
         """
-        from dagster_cloud.instance import DagsterCloudAgentInstance
-        from dagster._grpc.types import ExecuteRunArgs
-        from dagster import check
-
         run = context.dagster_run
         run_id = run.run_id
 
-        logger.info(f"Launching run {run_id} on Azure Container Apps")
+        logger.info("Launching run %s on Azure Container Apps", run_id)
 
         # Get the job origin for building the execute_run command
         # Following OSS ECS launcher pattern: use context.job_code_origin
@@ -121,9 +764,9 @@ class AcaRunLauncher(RunLauncher):
         # This is the canonical way to get location info in Dagster Cloud
 
         # Get deployment name from instance (preferred) or tags as fallback
-        if hasattr(self, '_instance') and hasattr(self._instance, 'deployment_name'):
-            deployment_name = self._instance.deployment_name
-        else:
+        try:
+            deployment_name = _INSTANCE_DEPLOYMENT_GETTER(self)
+        except AttributeError:
             deployment_name = (
                 run.tags.get("dagster/deployment") or
                 run.tags.get("dagster-cloud/deployment") or
@@ -132,12 +775,15 @@ class AcaRunLauncher(RunLauncher):
 
         # Get location name from remote_job_origin (same pattern as ECS launcher)
         location_name = None
-        if hasattr(run, 'remote_job_origin') and run.remote_job_origin:
+        if run.remote_job_origin is None:
+            # Expected for runs without a remote origin - the tags below cover them
+            logger.debug("Run %s has no remote_job_origin", run_id)
+        else:
             try:
-                location_name = run.remote_job_origin.repository_origin.code_location_origin.location_name
-                logger.info(f"Got location name from remote_job_origin: {location_name}")
-            except (AttributeError, TypeError) as e:
-                logger.warning(f"Could not get location from remote_job_origin: {e}")
+                location_name = _LOCATION_NAME_GETTER(run)
+                logger.info("Got location name from remote_job_origin: %s", location_name)
+            except AttributeError as e:
+                logger.warning("Could not get location from remote_job_origin: %s", e)
 
         # Fallback: try tags (less common but may exist in some setups)
         if not location_name:
@@ -146,76 +792,32 @@ class AcaRunLauncher(RunLauncher):
                 run.tags.get("dagster-cloud/code-location")
             )
             if location_name:
-                logger.info(f"Got location name from tags: {location_name}")
+                logger.info("Got location name from tags: %s", location_name)
 
         if not location_name:
             # Log available info for debugging
-            logger.error(f"Run {run_id} tags: {run.tags}")
-            logger.error(f"Run {run_id} has remote_job_origin: {hasattr(run, 'remote_job_origin')}")
+            logger.error("Run %s tags: %s", run_id, run.tags)
+            logger.error("Run %s has remote_job_origin: %s", run_id, hasattr(run, 'remote_job_origin'))
             raise ValueError(
                 f"Could not determine code location for run {run_id}. "
                 f"Available tags: {list(run.tags.keys())}"
             )
 
-        logger.info(f"Run {run_id} is for location {deployment_name}:{location_name}")
+        logger.info("Run %s is for location %s:%s", run_id, deployment_name, location_name)
 
         # Get the container image from the running code server
         # The code server should already be deployed for this location
-        code_server_name = f"dagster-{deployment_name}-{location_name}"[:32].lower().replace("_", "-")
-
-        try:
-            code_server_app = self.aca_client.container_apps.get(
-                resource_group_name=self.resource_group,
-                container_app_name=code_server_name
-            )
-            # Get image from the code server's container spec
-            container_image = code_server_app.template.containers[0].image
-            logger.info(f"Using image from code server {code_server_name}: {container_image}")
-        except Exception as e:
-            raise ValueError(
-                f"Could not find code server {code_server_name} to get image for run {run_id}. "
-                f"Ensure the code location is deployed before launching runs. Error: {e}"
-            )
-
-        # Generate Container App name for this run
-        app_name = f"dagster-run-{run_id[:8]}"
-        app_name = app_name.lower().replace("_", "-")
+        code_server_name = _app_name_for(deployment_name, location_name)
 
-        logger.info(f"Creating Container App for run: app={app_name}, image={container_image}")
-
-        # Build environment variables for the run
-        # Start with run-specific vars
-        job_name = run.remote_job_origin.job_name if run.remote_job_origin else "unknown"
-        env_vars = [
-            EnvironmentVar(name="DAGSTER_RUN_JOB_NAME", value=job_name),
-            EnvironmentVar(name="DAGSTER_RUN_ID", value=run_id),
-        ]
-
-        # Copy environment variables from the code server
-        # The run needs the same env vars as the code server (API keys, storage config, etc.)
-        if code_server_app.template.containers[0].env:
-            for env_var in code_server_app.template.containers[0].env:
-                # Don't copy DAGSTER_CLOUD_CODE_LOCATION_NAME as it's not needed for runs
-                if env_var.name not in ["DAGSTER_CLOUD_CODE_LOCATION_NAME"]:
-                    env_vars.append(env_var)
+        # Look the code server up on a worker thread (an ARM GET on a cache miss) while the
+        # run command is built here
+        spec_future = self._get_spec_pool().submit(self._find_code_server_spec, deployment_name, location_name)
 
         # Build the command for executing the run
         # Following the OSS ECS/Docker launcher pattern from dagster-aws/dagster-docker
-        # Strip container context to reduce payload size
-        repository_origin = job_origin.repository_origin
-        stripped_repository_origin = repository_origin._replace(container_context={})
-
-        # Fix entry_point to use executable_path with python -m dagster
-        # This handles the case where entry_point is just ["dagster"] but dagster
-        # is installed in a virtualenv and not in the system PATH
-        executable_path = repository_origin.executable_path
-        if executable_path:
-            # Use the Python executable with -m flag to invoke dagster module
-            fixed_entry_point = [executable_path, "-m", "dagster"]
-            stripped_repository_origin = stripped_repository_origin._replace(entry_point=fixed_entry_point)
-            logger.info(f"Using entry point from executable_path: {fixed_entry_point}")
-
-        stripped_job_origin = job_origin._replace(repository_origin=stripped_repository_origin)
+        stripped_job_origin = job_origin._replace(
+            repository_origin=_stripped_repository_origin(job_origin.repository_origin)
+        )
 
         # Create ExecuteRunArgs and use get_command_args() to build the command
         # This matches the pattern from Docker and ECS launchers
@@ -223,70 +825,74 @@ class AcaRunLauncher(RunLauncher):
         args = ExecuteRunArgs(
             job_origin=stripped_job_origin,
             run_id=run_id,
-            instance_ref=self._instance.get_ref(),
+            instance_ref=self._get_instance_ref(),
         )
 
         # Use the built-in method to generate the command
         # This will include the correct entry point from job_origin
         command = args.get_command_args()
 
-        logger.info(f"Run {run_id} will execute with command: {command}")
+        logger.info("Run %s will execute with command: %s", run_id, command)
+
+        try:
+            code_server_name, container_image, code_server_env = spec_future.result()
+            logger.info("Using image from code server %s: %s", code_server_name, container_image)
+        except ResourceNotFoundError as e:
+            # Only a missing code server is reported as such - throttling and other
+            # service errors propagate as themselves
+            raise ValueError(
+                f"Could not find code server {code_server_name} to get image for run {run_id}. "
+                f"Ensure the code location is deployed before launching runs. Error: {e}"
+            )
+
+        # Generate Container App name for this run
+        app_name = _run_app_name_for(run_id)
+
+        logger.info("Creating Container App for run: app=%s, image=%s", app_name, container_image)
+
+        # Build environment variables for the run: run-specific vars, then the code
+        # server's (the run needs the same API keys, storage config, etc.)
+        try:
+            job_name = _JOB_NAME_GETTER(run)
+        except AttributeError:
+            job_name = "unknown"
+        env_vars = [
+            EnvironmentVar(name="DAGSTER_RUN_JOB_NAME", value=job_name),
+            EnvironmentVar(name="DAGSTER_RUN_ID", value=run_id),
+            *code_server_env,
+        ]
 
         # Configure ACR registry credentials if using ACR
-        registries = None
-        registry_server = container_image.split('/')[0] if '/' in container_image else None
-        if registry_server and 'azurecr.io' in registry_server:
-            logger.info(f"Configuring ACR access for run: {registry_server}")
-            registries = [
-                RegistryCredentials(
-                    server=registry_server,
-                    identity=self.code_server_identity_id
-                )
-            ]
+        head, sep, _ = container_image.partition('/')
+        registry_server = head if sep else None
+        if registry_server and not registry_server.endswith(_ACR_SUFFIX):
+            registry_server = None
+
+        tags = self._run_base_tags.copy()
+        tags[_TAG_DEP] = deployment_name
+        tags[_TAG_LOC] = location_name
+        tags["dagster-run-id"] = run_id
 
         # Create Container App for the run
         container_app = ContainerApp(
             location=self.location,
             managed_environment_id=self.environment_id,
-            identity=ManagedServiceIdentity(
-                type="UserAssigned",
-                user_assigned_identities={self.code_server_identity_id: UserAssignedIdentity()}
-            ) if self.code_server_identity_id else None,
-            configuration=Configuration(
-                # No ingress - runs don't need external access
-                ingress=None,
-                secrets=[],
-                registries=registries,
-                active_revisions_mode="Single",
-            ),
+            identity=self._run_identity,
+            configuration=self._get_run_configuration(registry_server),
             template=Template(
                 containers=[
                     Container(
                         name="run-worker",
                         image=container_image,
-                        resources=ContainerResources(
-                            cpu=0.5,
-                            memory="1.0Gi"
-                        ),
+                        resources=self._run_resources,
                         env=env_vars,
                         # Set the command to execute the run using dagster api execute_run
                         command=command
                     )
                 ],
-                scale=Scale(
-                    min_replicas=0,  # Scale to 0 when done
-                    max_replicas=1,
-                    rules=[]
-                )
+                scale=self._run_scale
             ),
-            tags={
-                **self.required_tags,
-                "dagster-deployment": deployment_name,
-                "dagster-location": location_name,
-                "dagster-component": "run-worker",
-                "dagster-run-id": run_id,
-                "managed-by": "dagster-cloud-agent",
-            }
+            tags=tags
         )
 
         try:
@@ -299,31 +905,36 @@ class AcaRunLauncher(RunLauncher):
 
             # Don't wait for completion - return immediately
             # The run will execute asynchronously
-            logger.info(f"Run {run_id} Container App creation started: {app_name}")
+            logger.info("Run %s Container App creation started: %s", run_id, app_name)
 
         except Exception as e:
-            logger.error(f"Failed to launch run {run_id}: {e}")
+            logger.error("Failed to launch run %s: %s", run_id, e)
+            # The cached image may be stale (e.g. the code server was redeployed)
+            self._invalidate_code_server_spec(code_server_name)
             raise
 
     def terminate(self, run_id):
         """
         Terminate a running job by deleting its Container App.
         """
-        app_name = f"dagster-run-{run_id[:8]}"
-        app_name = app_name.lower().replace("_", "-")
+        app_name = _run_app_name_for(run_id)
 
         try:
-            logger.info(f"Terminating run {run_id} by deleting Container App {app_name}")
+            logger.info("Terminating run %s by deleting Container App %s", run_id, app_name)
             self.aca_client.container_apps.begin_delete(
                 resource_group_name=self.resource_group,
                 container_app_name=app_name
             )
         except Exception as e:
-            logger.warning(f"Failed to terminate run {run_id}: {e}")
+            logger.warning("Failed to terminate run %s: %s", run_id, e)
 
 
 class AcaServerHandle(NamedTuple):
-    """Handle representing an Azure Container App code server."""
+    """
+    Handle representing an Azure Container App code server.
+
+    A NamedTuple, so it is immutable, hashable and has no per-instance __dict__.
+    """
     app_name: str
     deployment_name: str
     location_name: str
@@ -331,6 +942,64 @@ class AcaServerHandle(NamedTuple):
     update_timestamp: float
 
 
+@functools.lru_cache(maxsize=1024)
+def _server_handle_for(
+    app_name: str,
+    deployment_name: str,
+    location_name: str,
+    agent_id: Optional[str],
+    update_timestamp_str: str,
+) -> AcaServerHandle:
+    """
+    Build the handle for a code server from its tag values, memoized per tag set.
+
+    An app whose tags are unchanged across reconcile ticks yields the identical handle.
+    """
+    return AcaServerHandle(
+        app_name=app_name,
+        deployment_name=deployment_name,
+        location_name=location_name,
+        agent_id=agent_id,
+        update_timestamp=float(update_timestamp_str),
+    )
+
+
+def _server_handle_from_tags(
+    app_name: str,
+    deployment_name: str,
+    location_name: str,
+    agent_id: Optional[str],
+    update_timestamp_str: Optional[str],
+) -> AcaServerHandle:
+    """Return the handle for a code server, stamping untimestamped apps with the current time."""
+    if update_timestamp_str:
+        return _server_handle_for(
+            app_name, deployment_name, location_name, agent_id, update_timestamp_str
+        )
+    return AcaServerHandle(
+        app_name=app_name,
+        deployment_name=deployment_name,
+        location_name=location_name,
+        agent_id=agent_id,
+        update_timestamp=time.time(),
+    )
+
+
+@dataclass(slots=True, eq=False)
+class _ReadinessState:
+    """
+    Readiness bookkeeping bound to one event loop.
+
+    Futures and the status poller task belong to the loop that created them, so each loop
+    calling into the launcher gets its own state rather than resetting another loop's.
+    """
+    # Futures awaiting the next batched status poll, keyed by app name
+    status_waiters: Dict[str, List[asyncio.Future]] = field(default_factory=dict)
+    status_task: Optional[asyncio.Task] = None
+    # In-flight readiness waits, keyed by server handle, so duplicate waits share one
+    ready_waits: Dict[AcaServerHandle, asyncio.Future] = field(default_factory=dict)
+
+
 class AcaUserCodeLauncher(DagsterCloudUserCodeLauncher):
     """
     Dagster Cloud user code launcher that deploys code servers to Azure Container Apps.
@@ -390,6 +1059,12 @@ class AcaUserCodeLauncher(DagsterCloudUserCodeLauncher):
         # Add Department tag if not present (required by Azure policy)
         if "Department" not in self.required_tags:
             self.required_tags["Department"] = os.getenv("AZURE_TAG_DEPARTMENT", "Engineering")
+        # Tags shared by every code server envelope, merged once
+        self._base_code_server_tags = {**self.required_tags, **_CODE_SERVER_BASE_TAGS}
+        # Code servers always get external TCP ingress on the gRPC port, which is
+        # exposed directly, so every endpoint connects on the same transport and port
+        self._default_transport = "tcp"
+        self._default_port = _CODE_SERVER_PORT
 
         # Container registry authentication
         # ACR (Azure Container Registry) uses managed identity - no credentials needed
@@ -399,26 +1074,44 @@ class AcaUserCodeLauncher(DagsterCloudUserCodeLauncher):
         # This identity is created by the Bicep template and has AcrPull permissions
         self.code_server_identity_id = os.getenv("CODE_SERVER_IDENTITY_ID")
         if self.code_server_identity_id:
-            logger.info(f"Code server identity configured: {self.code_server_identity_id}")
+            logger.info("Code server identity configured: %s", self.code_server_identity_id)
         else:
             logger.warning(
                 "CODE_SERVER_IDENTITY_ID not set. Code servers will not have managed identity. "
                 "This may prevent pulling images from ACR."
             )
 
-        # Azure Container Apps client
-        self.credential = DefaultAzureCredential()
-        self.aca_client = ContainerAppsAPIClient(
-            credential=self.credential,
-            subscription_id=self.subscription_id
-        )
+        # Azure Container Apps client (cached per subscription across launcher instances)
+        self.credential = _get_credential()
+        self.aca_client = _get_or_create_aca_client(self.credential, self.subscription_id)
 
         # Get managed environment ID
         self.environment_id = self._get_environment_id()
+        # Environment default domain, resolved lazily to derive code server FQDNs
+        self._environment_default_domain: Optional[str] = None
+
+        # In-flight create/update pollers from _start_new_server_spinup, keyed by server handle.
+        # _wait_for_new_server_ready waits on these instead of blocking the reconciler thread.
+        self._pending_pollers: Dict[AcaServerHandle, LROPoller] = {}
+
+        # Run launcher, created on first use by run_launcher()
+        self._run_launcher: Optional[AcaRunLauncher] = None
+        self._run_launcher_lock = threading.Lock()
+
+        # Batched status polling and shared readiness waits, per event loop
+        self._readiness_states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _ReadinessState]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._readiness_states_lock = threading.Lock()
+
+        # Snapshot of the resource group's apps shared by status and reconcile readers:
+        # (fetched_at, apps by name)
+        self._list_cache: Optional[tuple] = None
+        self._list_cache_lock = threading.Lock()
 
         logger.info(
-            f"Initialized AcaUserCodeLauncher: rg={self.resource_group}, "
-            f"env={self.environment_name}, cpu={self.cpu}, memory={self.memory}"
+            "Initialized AcaUserCodeLauncher: rg=%s, env=%s, cpu=%s, memory=%s",
+            self.resource_group, self.environment_name, self.cpu, self.memory
         )
 
     @property
@@ -443,11 +1136,104 @@ class AcaUserCodeLauncher(DagsterCloudUserCodeLauncher):
 
     def _get_environment_id(self) -> str:
         """Get the full resource ID of the Container Apps environment."""
-        return (
-            f"/subscriptions/{self.subscription_id}"
-            f"/resourceGroups/{self.resource_group}"
-            f"/providers/Microsoft.App/managedEnvironments/{self.environment_name}"
+        return _environment_id_for(self.subscription_id, self.resource_group, self.environment_name)
+
+    def _get_environment_default_domain(self) -> Optional[str]:
+        """Get the Container Apps environment's default domain, fetching it on first use."""
+        if self._environment_default_domain is None:
+            env = self.aca_client.managed_environments.get(
+                resource_group_name=self.resource_group,
+                environment_name=self.environment_name
+            )
+            self._environment_default_domain = env.default_domain
+        return self._environment_default_domain
+
+    def _get_container_app_cached(self, app_name: str) -> ContainerApp:
+        """
+        Get a Container App, reusing a result fetched within the last couple of seconds.
+
+        Callers must not mutate the returned app - it may be shared with other readers.
+        """
+        key = (self.subscription_id, self.resource_group, app_name)
+        now = time.monotonic()
+        with _APP_CACHE_LOCK:
+            cached = _APP_CACHE.get(key)
+        if cached is not None and now - cached[0] < _APP_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        app = self.aca_client.container_apps.get(
+            resource_group_name=self.resource_group,
+            container_app_name=app_name
         )
+        self._store_cached_apps([app], now)
+        return app
+
+    def _store_cached_apps(self, apps: Collection[ContainerApp], now: float) -> None:
+        """Record freshly fetched Container Apps in the GET cache."""
+        with _APP_CACHE_LOCK:
+            if len(_APP_CACHE) + len(apps) > _APP_CACHE_MAX_SIZE:
+                # Drop expired entries; if still full, start over
+                for stale_key in [k for k, (ts, _) in _APP_CACHE.items() if now - ts >= _APP_CACHE_TTL_SECONDS]:
+                    del _APP_CACHE[stale_key]
+                if len(_APP_CACHE) + len(apps) > _APP_CACHE_MAX_SIZE:
+                    _APP_CACHE.clear()
+            for app in apps:
+                _APP_CACHE[(self.subscription_id, self.resource_group, app.name)] = (now, app)
+
+    def _invalidate_cached_app(self, app_name: str) -> None:
+        """Drop a Container App from the GET and listing caches after it has been changed or deleted."""
+        with _APP_CACHE_LOCK:
+            _APP_CACHE.pop((self.subscription_id, self.resource_group, app_name), None)
+        with self._list_cache_lock:
+            self._list_cache = None
+        # Runs launched from here on should pick up the code server's new image and env
+        if self._run_launcher is not None:
+            self._run_launcher._invalidate_code_server_spec(app_name)
+
+    def _snapshot_apps(self) -> Dict[str, ContainerApp]:
+        """
+        Return the resource group's Container Apps by name, sharing one listing for a few seconds.
+
+        A reconcile tick reads apps from several places (per-location handles, all handles,
+        list_code_servers, status checks); one paged list_by_resource_group call serves them
+        all instead of a GET per app. Concurrent callers wait on the lock and reuse the
+        listing fetched by the first.
+
+        ARM's server-side tag filter (resources.list_by_resource_group with $filter) is not
+        used: generic resource listings carry neither tags nor Container App properties
+        when filtered, so every match would then need its own GET.
+        """
+        with self._list_cache_lock:
+            if self._list_cache is not None:
+                fetched_at, apps = self._list_cache
+                if time.monotonic() - fetched_at < _LIST_CACHE_TTL_SECONDS:
+                    return apps
+
+            apps = {
+                app.name: app
+                for app in self.aca_client.container_apps.list_by_resource_group(
+                    resource_group_name=self.resource_group
+                )
+            }
+            now = time.monotonic()
+            self._list_cache = (now, apps)
+        # The listing carries full app bodies, so it also answers per-app GETs for a while
+        self._store_cached_apps(apps.values(), now)
+        return apps
+
+    def _iter_managed_apps(self) -> Iterator[tuple]:
+        """
+        Iterate the Container Apps in the resource group that are managed by this agent.
+
+        Returns:
+            Iterator of (app, tag view) pairs, where the view is the tuple returned by _view
+        """
+        for app in self._snapshot_apps().values():
+            if not app.tags:
+                continue
+            view = _view(app.tags)
+            if view[0] == _MANAGED_BY_VALUE:
+                yield app, view
 
     def _get_registry_credentials(self, image: str) -> tuple[list[Secret], list[RegistryCredentials]]:
         """
@@ -464,47 +1250,89 @@ class AcaUserCodeLauncher(DagsterCloudUserCodeLauncher):
         """
         # Extract registry server from image URL
         # Format: registry.com/repo:tag or registry.com:port/repo:tag
-        registry_server = image.split('/')[0] if '/' in image else None
-
-        if not registry_server:
-            # No registry specified (e.g., "ubuntu:latest") - use Docker Hub public
-            return [], []
-
-        # Check if this is Azure Container Registry (ACR)
-        if 'azurecr.io' in registry_server:
-            logger.info(f"Using Azure Container Registry {registry_server} with managed identity")
-            # ACR with managed identity - configure registry to use the managed identity
-            # The Container App's managed identity must have AcrPull role on the ACR
-            if not self.code_server_identity_id:
-                raise ValueError(
-                    "CODE_SERVER_IDENTITY_ID environment variable not set. "
-                    "Managed identity is required for ACR authentication."
-                )
+        head, sep, _ = image.partition('/')
+        secrets, registries = _registry_credentials_for(head if sep else None, self.code_server_identity_id)
+        return list(secrets), list(registries)
 
-            registries = [
-                RegistryCredentials(
-                    server=registry_server,
-                    identity=self.code_server_identity_id  # Use managed identity for authentication
-                )
-            ]
-            return [], registries
+    def _build_container_app_envelope(
+        self,
+        deployment_name: str,
+        location_name: str,
+        image: str,
+        cpu: float,
+        memory: str,
+        env_vars: List[EnvironmentVar],
+        agent_id: Optional[str] = None,
+        update_timestamp: Optional[float] = None,
+        want_ingress: bool = False,
+    ) -> ContainerApp:
+        """
+        Build the ContainerApp envelope for a code server.
 
-        # Check if this is AWS ECR (serverless mode - not supported for hybrid)
-        if 'ecr' in registry_server and 'amazonaws.com' in registry_server:
-            raise ValueError(
-                f"Code location uses AWS ECR image ({registry_server}). "
-                "This indicates the code location is configured for Dagster Cloud Serverless mode. "
-                "For hybrid deployments with Azure Container Apps, please:\n"
-                "1. Build and push your code location image to Azure Container Registry (ACR)\n"
-                "2. Update the code location in Dagster Cloud to use the ACR image\n"
-                "3. Grant the agent's managed identity 'AcrPull' role on your ACR"
-            )
+        Args:
+            deployment_name: Dagster deployment name
+            location_name: Code location name
+            image: Container image URL
+            cpu: vCPU cores for the container
+            memory: Memory for the container (e.g., "1.0Gi")
+            env_vars: Environment variables for the container
+            agent_id: ID of the agent launching the server, recorded as a tag
+            update_timestamp: Code location update timestamp, recorded as a tag
+            want_ingress: Whether to expose the gRPC port via TCP ingress
 
-        # Other registries not supported
-        raise ValueError(
-            f"Unsupported container registry: {registry_server}. "
-            "Azure Container Apps hybrid agent only supports Azure Container Registry (ACR). "
-            "Please push your image to ACR and update your code location configuration."
+        Returns:
+            ContainerApp ready to pass to begin_create_or_update
+        """
+        # Get registry credentials for pulling the image
+        secrets, registries = self._get_registry_credentials(image)
+
+        # Policy-required tags (e.g., Department) plus the code server base tags
+        tags = self._base_code_server_tags.copy()
+        tags[_TAG_DEP] = deployment_name
+        tags[_TAG_LOC] = location_name
+        if update_timestamp is not None:
+            tags[_TAG_AGENT] = agent_id or "unknown"
+            tags[_TAG_TS] = str(update_timestamp)
+
+        return ContainerApp(
+            location=self.location,
+            managed_environment_id=self.environment_id,
+            # Assign code server managed identity for ACR access
+            identity=ManagedServiceIdentity(
+                type="UserAssigned",
+                user_assigned_identities={self.code_server_identity_id: UserAssignedIdentity()}
+            ) if self.code_server_identity_id else None,
+            configuration=Configuration(
+                # Ingress for gRPC communication with VNET (external TCP on the gRPC port)
+                ingress=Ingress(
+                    external=True,
+                    target_port=self._default_port,
+                    transport=self._default_transport,
+                ) if want_ingress else None,
+                # Registry credentials (if needed for private registries)
+                secrets=secrets,
+                registries=registries if registries else None,
+                # Revisions mode: Single (rolling updates)
+                active_revisions_mode="Single",
+                max_inactive_revisions=_CODE_SERVER_MAX_INACTIVE_REVISIONS,
+            ),
+            template=Template(
+                containers=[
+                    Container(
+                        name="code-server",
+                        image=image,
+                        resources=ContainerResources(
+                            cpu=cpu,
+                            memory=memory
+                        ),
+                        env=env_vars,
+                        # Only probe the gRPC port on envelopes whose ingress serves it
+                        probes=_CODE_SERVER_PROBES if want_ingress else None,
+                    )
+                ],
+                scale=_CODE_SERVER_SCALE
+            ),
+            tags=tags
         )
 
     def launch_code_server(
@@ -529,14 +1357,11 @@ class AcaUserCodeLauncher(DagsterCloudUserCodeLauncher):
             Container App name (used to track/manage the app)
         """
         # Generate Container App name
-        # Format: dagster-{deployment}-{location}
-        # Sanitize for ACA naming rules (lowercase alphanumeric and hyphens, max 32 chars)
-        app_name = f"dagster-{deployment_name}-{location_name}"[:32]
-        app_name = app_name.lower().replace("_", "-")
+        app_name = _app_name_for(deployment_name, location_name)
 
         logger.info(
-            f"Launching code server: deployment={deployment_name}, "
-            f"location={location_name}, image={image}, app={app_name}"
+            "Launching code server: deployment=%s, location=%s, image=%s, app=%s",
+            deployment_name, location_name, image, app_name
         )
 
         # Build environment variables
@@ -551,90 +1376,34 @@ class AcaUserCodeLauncher(DagsterCloudUserCodeLauncher):
             cpu = container_context.get("cpu", cpu)
             memory = container_context.get("memory", memory)
 
-        # Get registry credentials for pulling the image
-        secrets, registries = self._get_registry_credentials(image)
-
         # Create Container App configuration
-        container_app = ContainerApp(
-            location=self.location,
-            managed_environment_id=self.environment_id,
-            # Assign code server managed identity for ACR access
-            identity=ManagedServiceIdentity(
-                type="UserAssigned",
-                user_assigned_identities={self.code_server_identity_id: UserAssignedIdentity()}
-            ) if self.code_server_identity_id else None,
-            configuration=Configuration(
-                # No ingress needed - code servers communicate via internal gRPC
-                ingress=None,
-                # Registry credentials (if needed for private registries)
-                secrets=secrets,
-                registries=registries if registries else None,
-                # Revisions mode: Single (rolling updates)
-                # For zero-downtime: use Multiple
-                active_revisions_mode="Single",
-            ),
-            template=Template(
-                containers=[
-                    Container(
-                        name="code-server",
-                        image=image,
-                        resources=ContainerResources(
-                            cpu=cpu,
-                            memory=memory
-                        ),
-                        env=env_vars,
-                        # Code servers typically expose port 4000 for gRPC
-                        # No need to expose publicly - internal only
-                    )
-                ],
-                scale=Scale(
-                    min_replicas=1,  # Always running
-                    max_replicas=1,  # Single instance per code location
-                    # No scale rules - code servers don't auto-scale
-                    rules=[]
-                )
-            ),
-            # Tags for tracking and management
-            tags={
-                **self.required_tags,  # Include policy-required tags (e.g., Department)
-                "dagster-deployment": deployment_name,
-                "dagster-location": location_name,
-                "dagster-component": "code-server",
-                "managed-by": "dagster-cloud-agent"
-            }
+        container_app = self._build_container_app_envelope(
+            deployment_name, location_name, image, cpu, memory, env_vars
         )
 
         try:
-            # Check if Container App already exists
-            existing_app = None
-            try:
-                existing_app = self.aca_client.container_apps.get(
-                    resource_group_name=self.resource_group,
-                    container_app_name=app_name
-                )
-                logger.info(f"Container App {app_name} already exists, updating...")
-            except Exception:
-                logger.info(f"Container App {app_name} does not exist, creating...")
-
-            # Create or update the Container App
+            # Create or update the Container App (begin_create_or_update is an idempotent upsert)
+            logger.info("Creating or updating Container App %s", app_name)
             poller = self.aca_client.container_apps.begin_create_or_update(
                 resource_group_name=self.resource_group,
                 container_app_name=app_name,
-                container_app_envelope=container_app
+                container_app_envelope=container_app,
+                polling=_lro_polling()
             )
 
             # Wait for creation/update to complete (typically 30-60 seconds)
             result = poller.result(timeout=180)
+            self._invalidate_cached_app(app_name)
 
             logger.info(
-                f"Successfully launched code server: {app_name} "
-                f"(provisioning_state={result.provisioning_state})"
+                "Successfully launched code server: %s (provisioning_state=%s)",
+                app_name, result.provisioning_state
             )
 
             return app_name
 
         except Exception as e:
-            logger.error(f"Failed to launch code server {app_name}: {e}")
+            logger.error("Failed to launch code server %s: %s", app_name, e)
             raise
 
     def update_code_server(
@@ -657,7 +1426,7 @@ class AcaUserCodeLauncher(DagsterCloudUserCodeLauncher):
             image: New container image URL
             environment_variables: Updated environment variables
         """
-        logger.info(f"Updating code server: {app_name} with image {image}")
+        logger.info("Updating code server: %s with image %s", app_name, image)
 
         try:
             # Get existing app
@@ -671,51 +1440,74 @@ class AcaUserCodeLauncher(DagsterCloudUserCodeLauncher):
 
             # Update environment variables if provided
             if environment_variables:
-                env_vars = []
-                for key, value in environment_variables.items():
-                    env_vars.append(EnvironmentVar(name=key, value=value))
-                existing_app.template.containers[0].env = env_vars
-
-            # Apply update (triggers blue-green deployment)
-            poller = self.aca_client.container_apps.begin_create_or_update(
+                existing_app.template.containers[0].env = [
+                    EnvironmentVar(name=key, value=value)
+                    for key, value in environment_variables.items()
+                ]
+
+            # Apply update as a PATCH carrying only the template (triggers blue-green deployment).
+            # The container list is replaced wholesale by a PATCH, so it is sent in full from
+            # the fetched app to preserve resources and env vars that aren't being changed.
+            poller = self.aca_client.container_apps.begin_update(
                 resource_group_name=self.resource_group,
                 container_app_name=app_name,
-                container_app_envelope=existing_app
+                container_app_envelope=ContainerApp(
+                    location=existing_app.location,
+                    template=existing_app.template
+                ),
+                polling=_lro_polling()
             )
 
-            result = poller.result(timeout=180)
+            poller.result(timeout=180)
+            self._invalidate_cached_app(app_name)
 
-            logger.info(
-                f"Successfully updated code server: {app_name} "
-                f"(provisioning_state={result.provisioning_state})"
-            )
+            logger.info("Successfully updated code server: %s", app_name)
 
         except Exception as e:
-            logger.error(f"Failed to update code server {app_name}: {e}")
+            logger.error("Failed to update code server %s: %s", app_name, e)
             raise
 
-    def terminate_code_server(self, app_name: str):
+    def terminate_code_server(self, app_name: str, wait: bool = False):
         """
         Terminate a code server by deleting the Container App.
 
         Note: Typically, code servers are long-lived and NOT terminated.
         This method exists for cleanup scenarios (e.g., code location deleted).
 
+        By default this returns once ARM has accepted the DELETE; the operation finishes
+        on the poller's own thread, which drops the app from the caches when it completes.
+
         Args:
             app_name: Container App name to delete
+            wait: Block until the delete has finished (up to 120 seconds)
         """
-        logger.info(f"Terminating code server: {app_name}")
+        logger.info("Terminating code server: %s", app_name)
 
         try:
             poller = self.aca_client.container_apps.begin_delete(
                 resource_group_name=self.resource_group,
-                container_app_name=app_name
+                container_app_name=app_name,
+                polling=_lro_polling()
             )
+            self._invalidate_cached_app(app_name)
+
+            if not wait:
+                def _on_deleted(polling_method) -> None:
+                    self._invalidate_cached_app(app_name)
+                    logger.info(
+                        "Delete of code server %s finished (status=%s)", app_name, polling_method.status()
+                    )
+
+                poller.add_done_callback(_on_deleted)
+                logger.info("Delete of code server %s submitted", app_name)
+                return
+
             poller.result(timeout=120)
-            logger.info(f"Successfully terminated code server: {app_name}")
+            self._invalidate_cached_app(app_name)
+            logger.info("Successfully terminated code server: %s", app_name)
 
         except Exception as e:
-            logger.error(f"Failed to terminate code server {app_name}: {e}")
+            logger.error("Failed to terminate code server %s: %s", app_name, e)
             raise
 
     def get_code_server_status(self, app_name: str) -> Dict:
@@ -729,26 +1521,24 @@ class AcaUserCodeLauncher(DagsterCloudUserCodeLauncher):
             Dictionary with status information
         """
         try:
-            app = self.aca_client.container_apps.get(
-                resource_group_name=self.resource_group,
-                container_app_name=app_name
-            )
+            # Served from the shared listing; only apps it doesn't know yet cost a GET
+            app = self._snapshot_apps().get(app_name) or self._get_container_app_cached(app_name)
 
             # Get latest revision status
             latest_revision = app.latest_revision_name
-            revision_fqdn = app.latest_revision_fqdn if hasattr(app, 'latest_revision_fqdn') else None
+            revision_fqdn = getattr(app, 'latest_revision_fqdn', None)
 
             return {
                 "name": app_name,
                 "provisioning_state": app.provisioning_state,
                 "latest_revision": latest_revision,
-                "latest_ready": app.latest_ready_revision_name if hasattr(app, 'latest_ready_revision_name') else None,
-                "running_status": app.running_status if hasattr(app, 'running_status') else "Unknown",
+                "latest_ready": getattr(app, 'latest_ready_revision_name', None),
+                "running_status": getattr(app, 'running_status', "Unknown"),
                 "fqdn": revision_fqdn,
             }
 
         except Exception as e:
-            logger.warning(f"Failed to get status for {app_name}: {e}")
+            logger.warning("Failed to get status for %s: %s", app_name, e)
             return {"name": app_name, "error": str(e)}
 
     def list_code_servers(self, deployment_name: Optional[str] = None) -> List[Dict]:
@@ -762,29 +1552,23 @@ class AcaUserCodeLauncher(DagsterCloudUserCodeLauncher):
             List of Container App information
         """
         try:
-            apps = self.aca_client.container_apps.list_by_resource_group(
-                resource_group_name=self.resource_group
-            )
-
             results = []
-            for app in apps:
-                # Filter by Dagster tags
-                if app.tags and app.tags.get("managed-by") == "dagster-cloud-agent":
-                    if deployment_name and app.tags.get("dagster-deployment") != deployment_name:
-                        continue
-
-                    results.append({
-                        "name": app.name,
-                        "deployment": app.tags.get("dagster-deployment"),
-                        "location": app.tags.get("dagster-location"),
-                        "provisioning_state": app.provisioning_state,
-                        "latest_revision": app.latest_revision_name,
-                    })
+            for app, (_, app_deployment, app_location, _, _) in self._iter_managed_apps():
+                if deployment_name and app_deployment != deployment_name:
+                    continue
+
+                results.append({
+                    "name": app.name,
+                    "deployment": app_deployment,
+                    "location": app_location,
+                    "provisioning_state": app.provisioning_state,
+                    "latest_revision": app.latest_revision_name,
+                })
 
             return results
 
         except Exception as e:
-            logger.error(f"Failed to list code servers: {e}")
+            logger.error("Failed to list code servers: %s", e)
             return []
 
     def _build_environment_variables(
@@ -804,22 +1588,14 @@ class AcaUserCodeLauncher(DagsterCloudUserCodeLauncher):
         Returns:
             List of EnvironmentVar objects
         """
-        env_vars = [
-            EnvironmentVar(name="DAGSTER_CLOUD_DEPLOYMENT_NAME", value=deployment_name),
-            EnvironmentVar(name="DAGSTER_CLOUD_CODE_LOCATION_NAME", value=location_name),
-            EnvironmentVar(
-                name="DAGSTER_CLOUD_URL",
-                value=os.getenv("DAGSTER_CLOUD_URL", "https://dagster.cloud")
-            ),
+        return [
+            # Shared across launches - never mutated
+            *_location_env_vars(deployment_name, location_name),
+            _BASE_ENV_VAR_URL,
+            # Add custom environment variables
+            *(EnvironmentVar(name=key, value=value) for key, value in (custom_env or {}).items()),
         ]
 
-        # Add custom environment variables
-        if custom_env:
-            for key, value in custom_env.items():
-                env_vars.append(EnvironmentVar(name=key, value=value))
-
-        return env_vars
-
     def scale_code_server(self, app_name: str, min_replicas: int = 1, max_replicas: int = 1):
         """
         Scale a code server (change replica count).
@@ -832,31 +1608,31 @@ class AcaUserCodeLauncher(DagsterCloudUserCodeLauncher):
             min_replicas: Minimum replicas
             max_replicas: Maximum replicas
         """
-        logger.info(f"Scaling code server {app_name}: min={min_replicas}, max={max_replicas}")
+        logger.info("Scaling code server %s: min=%s, max=%s", app_name, min_replicas, max_replicas)
 
         try:
-            # Get existing app
-            app = self.aca_client.container_apps.get(
-                resource_group_name=self.resource_group,
-                container_app_name=app_name
-            )
-
-            # Update scale configuration
-            app.template.scale.min_replicas = min_replicas
-            app.template.scale.max_replicas = max_replicas
-
-            # Apply update
-            poller = self.aca_client.container_apps.begin_create_or_update(
+            # PATCH only the scale settings - no GET or full envelope PUT required
+            poller = self.aca_client.container_apps.begin_update(
                 resource_group_name=self.resource_group,
                 container_app_name=app_name,
-                container_app_envelope=app
+                container_app_envelope=ContainerApp(
+                    location=self.location,
+                    template=Template(
+                        scale=Scale(
+                            min_replicas=min_replicas,
+                            max_replicas=max_replicas
+                        )
+                    )
+                ),
+                polling=_lro_polling()
             )
 
             poller.result(timeout=120)
-            logger.info(f"Successfully scaled code server: {app_name}")
+            self._invalidate_cached_app(app_name)
+            logger.info("Successfully scaled code server: %s", app_name)
 
         except Exception as e:
-            logger.error(f"Failed to scale code server {app_name}: {e}")
+            logger.error("Failed to scale code server %s: %s", app_name, e)
             raise
 
     def get_code_server_logs(self, app_name: str, tail: int = 100) -> str:
@@ -898,37 +1674,23 @@ Or query Log Analytics:
         """
         handles = []
         try:
-            # List all Container Apps in the resource group
-            apps = self.aca_client.container_apps.list_by_resource_group(
-                resource_group_name=self.resource_group
-            )
-
-            # Filter for code servers matching this deployment and location
-            for app in apps:
-                if not app.tags or app.tags.get("managed-by") != "dagster-cloud-agent":
+            # Filter the shared listing of Dagster-managed Container Apps for
+            # code servers matching this deployment and location
+            for app, view in self._iter_managed_apps():
+                _, app_deployment, app_location, agent_id, update_timestamp_str = view
+                if app_deployment != deployment_name or app_location != location_name:
                     continue
 
-                if (app.tags.get("dagster-deployment") == deployment_name and
-                    app.tags.get("dagster-location") == location_name):
-
-                    # Extract metadata from tags
-                    agent_id = app.tags.get("dagster-agent-id")
-                    update_timestamp_str = app.tags.get("dagster-update-timestamp")
-                    update_timestamp = float(update_timestamp_str) if update_timestamp_str else time.time()
-
-                    handles.append(AcaServerHandle(
-                        app_name=app.name,
-                        deployment_name=deployment_name,
-                        location_name=location_name,
-                        agent_id=agent_id,
-                        update_timestamp=update_timestamp
-                    ))
+                handles.append(_server_handle_from_tags(
+                    app.name, deployment_name, location_name, agent_id, update_timestamp_str
+                ))
 
             return handles
 
         except Exception as e:
             logger.error(
-                f"Failed to get server handles for {deployment_name}:{location_name}: {e}"
+                "Failed to get server handles for %s:%s: %s",
+                deployment_name, location_name, e
             )
             return []
 
@@ -940,34 +1702,21 @@ Or query Log Analytics:
         """
         handles = []
         try:
-            # List all Container Apps in the resource group
-            apps = self.aca_client.container_apps.list_by_resource_group(
-                resource_group_name=self.resource_group
-            )
-
-            # Filter for Dagster-managed code servers
-            for app in apps:
-                if not app.tags or app.tags.get("managed-by") != "dagster-cloud-agent":
-                    continue
-
-                deployment_name = app.tags.get("dagster-deployment", "unknown")
-                location_name = app.tags.get("dagster-location", "unknown")
-                agent_id = app.tags.get("dagster-agent-id")
-                update_timestamp_str = app.tags.get("dagster-update-timestamp")
-                update_timestamp = float(update_timestamp_str) if update_timestamp_str else time.time()
-
-                handles.append(AcaServerHandle(
-                    app_name=app.name,
-                    deployment_name=deployment_name,
-                    location_name=location_name,
-                    agent_id=agent_id,
-                    update_timestamp=update_timestamp
+            # Walk the shared listing of Dagster-managed Container Apps
+            for app, view in self._iter_managed_apps():
+                _, deployment_name, location_name, agent_id, update_timestamp_str = view
+                handles.append(_server_handle_from_tags(
+                    app.name,
+                    deployment_name or "unknown",
+                    location_name or "unknown",
+                    agent_id,
+                    update_timestamp_str,
                 ))
 
             return handles
 
         except Exception as e:
-            logger.error(f"Failed to list server handles: {e}")
+            logger.error("Failed to list server handles: %s", e)
             return []
 
     def _remove_server_handle(self, server_handle: AcaServerHandle) -> None:
@@ -976,11 +1725,14 @@ Or query Log Analytics:
 
         This deletes the Container App.
         """
-        logger.info(f"Removing server: {server_handle.app_name}")
+        logger.info("Removing server: %s", server_handle.app_name)
+        # Nothing will wait on this handle's spinup any more
+        self._pending_pollers.pop(server_handle, None)
         try:
-            self.terminate_code_server(server_handle.app_name)
+            # Wait for the delete: the reconciler may recreate an app with the same name next
+            self.terminate_code_server(server_handle.app_name, wait=True)
         except Exception as e:
-            logger.error(f"Failed to remove server {server_handle.app_name}: {e}")
+            logger.error("Failed to remove server %s: %s", server_handle.app_name, e)
             raise
 
     def _start_new_server_spinup(
@@ -1005,12 +1757,11 @@ Or query Log Analytics:
             )
 
         # Generate Container App name
-        app_name = f"dagster-{deployment_name}-{location_name}"[:32]
-        app_name = app_name.lower().replace("_", "-")
+        app_name = _app_name_for(deployment_name, location_name)
 
         logger.info(
-            f"Starting server spinup: deployment={deployment_name}, "
-            f"location={location_name}, image={image}, app={app_name}"
+            "Starting server spinup: deployment=%s, location=%s, image=%s, app=%s",
+            deployment_name, location_name, image, app_name
         )
 
         # Build environment variables
@@ -1028,57 +1779,17 @@ Or query Log Analytics:
         # Get agent ID for tracking
         agent_id = self._instance.instance_uuid if hasattr(self, '_instance') and self._instance else None
 
-        # Get registry credentials for pulling the image
-        secrets, registries = self._get_registry_credentials(image)
-
-        # Create Container App configuration
-        container_app = ContainerApp(
-            location=self.location,
-            managed_environment_id=self.environment_id,
-            # Assign code server managed identity for ACR access
-            identity=ManagedServiceIdentity(
-                type="UserAssigned",
-                user_assigned_identities={self.code_server_identity_id: UserAssignedIdentity()}
-            ) if self.code_server_identity_id else None,
-            configuration=Configuration(
-                # Enable ingress for gRPC communication with VNET
-                ingress=Ingress(
-                    external=True,  # External ingress for VNET connectivity
-                    target_port=4000,  # Standard Dagster gRPC port
-                    transport="tcp",  # TCP transport for direct gRPC connection
-                ),
-                # Registry credentials (if needed for private registries)
-                secrets=secrets,
-                registries=registries if registries else None,
-                active_revisions_mode="Single",
-            ),
-            template=Template(
-                containers=[
-                    Container(
-                        name="code-server",
-                        image=image,
-                        resources=ContainerResources(
-                            cpu=cpu,
-                            memory=memory
-                        ),
-                        env=env_vars,
-                    )
-                ],
-                scale=Scale(
-                    min_replicas=1,
-                    max_replicas=1,
-                    rules=[]
-                )
-            ),
-            tags={
-                **self.required_tags,  # Include policy-required tags (e.g., Department)
-                "dagster-deployment": deployment_name,
-                "dagster-location": location_name,
-                "dagster-component": "code-server",
-                "managed-by": "dagster-cloud-agent",
-                "dagster-agent-id": agent_id or "unknown",
-                "dagster-update-timestamp": str(desired_entry.update_timestamp),
-            }
+        # Create Container App configuration with TCP ingress for gRPC
+        container_app = self._build_container_app_envelope(
+            deployment_name,
+            location_name,
+            image,
+            cpu,
+            memory,
+            env_vars,
+            agent_id=agent_id,
+            update_timestamp=desired_entry.update_timestamp,
+            want_ingress=True,
         )
 
         try:
@@ -1086,16 +1797,8 @@ Or query Log Analytics:
             poller = self.aca_client.container_apps.begin_create_or_update(
                 resource_group_name=self.resource_group,
                 container_app_name=app_name,
-                container_app_envelope=container_app
-            )
-
-            # Wait for the initial creation to start
-            # (We'll wait for full readiness in _wait_for_new_server_ready)
-            result = poller.result(timeout=180)
-
-            logger.info(
-                f"Server spinup started: {app_name} "
-                f"(provisioning_state={result.provisioning_state})"
+                container_app_envelope=container_app,
+                polling=_lro_polling()
             )
 
             # Create server handle
@@ -1107,41 +1810,20 @@ Or query Log Analytics:
                 update_timestamp=desired_entry.update_timestamp
             )
 
-            # Get the Container App's FQDN for gRPC endpoint
-            # The FQDN format is: <app-name>.<env-domain>
-            app = self.aca_client.container_apps.get(
-                resource_group_name=self.resource_group,
-                container_app_name=app_name
-            )
+            # Don't block the reconciler thread on provisioning -
+            # _wait_for_new_server_ready waits for the poller to complete
+            self._pending_pollers[server_handle] = poller
+            self._invalidate_cached_app(app_name)
 
-            # Use the app's FQDN if available, otherwise use app name
-            host = app.configuration.ingress.fqdn if (
-                app.configuration and
-                app.configuration.ingress and
-                app.configuration.ingress.fqdn
-            ) else app_name
-
-            # Determine the correct port based on ingress configuration
-            # - TCP transport: Always use target port 4000 (exposes port directly)
-            # - HTTP/2 transport with external ingress: Use port 443 (HTTPS)
-            # - HTTP/2 transport with internal ingress: Use port 4000
-            transport = (app.configuration and
-                        app.configuration.ingress and
-                        app.configuration.ingress.transport) or "tcp"
-            is_external = (app.configuration and
-                          app.configuration.ingress and
-                          app.configuration.ingress.external)
-
-            # TCP transport always uses target port (4000)
-            # HTTP/2 external uses 443, HTTP/2 internal uses 4000
-            if transport.lower() == "tcp":
-                port = 4000
-            elif is_external:
-                port = 443
-            else:
-                port = 4000
+            logger.info("Server spinup started: %s", app_name)
+
+            # Derive the Container App's FQDN for the gRPC endpoint without waiting for provisioning
+            # The FQDN format is: <app-name>.<env-domain>
+            default_domain = self._get_environment_default_domain()
+            host = f"{app_name}.{default_domain}" if default_domain else app_name
+            port = self._default_port
 
-            logger.info(f"Connecting to {host}:{port} (transport={transport}, external={is_external})")
+            logger.info("Connecting to %s:%s (transport=%s)", host, port, self._default_transport)
 
             server_endpoint = ServerEndpoint(
                 host=host,
@@ -1156,7 +1838,122 @@ Or query Log Analytics:
             )
 
         except Exception as e:
-            logger.error(f"Failed to start server spinup for {app_name}: {e}")
+            logger.error("Failed to start server spinup for %s: %s", app_name, e)
+            raise
+
+    def _readiness_state(self) -> _ReadinessState:
+        """Return the readiness state of the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        with self._readiness_states_lock:
+            state = self._readiness_states.get(loop)
+            if state is None:
+                state = self._readiness_states[loop] = _ReadinessState()
+            return state
+
+    def _request_app_status(self, app_name: str) -> "asyncio.Future[Optional[ContainerApp]]":
+        """
+        Register for an app's status from the next batched status poll.
+
+        The returned future resolves to the app (or None if it isn't listed yet).
+        """
+        state = self._readiness_state()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        state.status_waiters.setdefault(app_name, []).append(future)
+        if state.status_task is None:
+            state.status_task = loop.create_task(self._poll_app_statuses(state))
+        return future
+
+    async def _list_app_statuses(self, aio_client: AioContainerAppsAPIClient) -> Dict[str, ContainerApp]:
+        """List the resource group's Container Apps by name, following all pages."""
+        return {
+            app.name: app
+            async for app in aio_client.container_apps.list_by_resource_group(
+                resource_group_name=self.resource_group
+            )
+        }
+
+    async def _get_app_status(
+        self, aio_client: AioContainerAppsAPIClient, app_name: str
+    ) -> Optional[ContainerApp]:
+        """Get one Container App, or None if it doesn't exist."""
+        try:
+            return await aio_client.container_apps.get(
+                resource_group_name=self.resource_group,
+                container_app_name=app_name
+            )
+        except ResourceNotFoundError:
+            return None
+
+    async def _fetch_app_statuses(
+        self, aio_client: AioContainerAppsAPIClient, app_names: List[str]
+    ) -> Dict[str, Optional[ContainerApp]]:
+        """
+        Fetch the Container Apps for a tick's pending app names.
+
+        A few apps are read with one GET each, bounded by _STATUS_CALL_TIMEOUT_SECONDS. From
+        _STATUS_LIST_MIN_APPS on, one paged list of the resource group is shared instead; it
+        has no hard timeout, since its duration grows with the size of the resource group.
+        """
+        if len(app_names) >= _STATUS_LIST_MIN_APPS:
+            return await self._list_app_statuses(aio_client)
+        apps = await asyncio.wait_for(
+            asyncio.gather(*(self._get_app_status(aio_client, app_name) for app_name in app_names)),
+            timeout=_STATUS_CALL_TIMEOUT_SECONDS
+        )
+        return dict(zip(app_names, apps))
+
+    async def _poll_app_statuses(self, state: _ReadinessState) -> None:
+        """
+        Resolve every pending status request once per tick.
+
+        Concurrent readiness waits (e.g. during a deployment rollout) share each tick's ARM
+        calls: a GET per app while only a few are pending, one list_by_resource_group call
+        past that. Ticks are spaced with full-jitter exponential backoff, and the poller
+        exits once nobody is waiting.
+        """
+        tick = 0
+        delays = _backoff_schedule()
+        current_task = asyncio.current_task()
+        try:
+            async with AioContainerAppsAPIClient(
+                credential=_AioCredential(self.credential),
+                subscription_id=self.subscription_id
+            ) as aio_client:
+                while state.status_waiters:
+                    waiters, state.status_waiters = state.status_waiters, {}
+                    try:
+                        apps = await self._fetch_app_statuses(aio_client, list(waiters))
+                    except asyncio.TimeoutError:
+                        # Keep the waiters for the next tick rather than failing them
+                        logger.debug("Container App status reads timed out on tick %d", tick + 1)
+                        for app_name, futures in waiters.items():
+                            state.status_waiters.setdefault(app_name, []).extend(futures)
+                    except Exception as e:
+                        for futures in waiters.values():
+                            for future in futures:
+                                if not future.done():
+                                    future.set_exception(e)
+                    else:
+                        for app_name, futures in waiters.items():
+                            for future in futures:
+                                if not future.done():
+                                    future.set_result(apps.get(app_name))
+
+                    await asyncio.sleep(next(delays))
+                    tick += 1
+
+                # Nobody is waiting - let the next request start a fresh poller
+                state.status_task = None
+        except BaseException:
+            # Don't leave waiters hanging if this poller failed while still the active one
+            if state.status_task is current_task:
+                state.status_task = None
+                waiters, state.status_waiters = state.status_waiters, {}
+                for futures in waiters.values():
+                    for future in futures:
+                        if not future.done():
+                            future.set_exception(RuntimeError("Container App status poller stopped"))
             raise
 
     async def _wait_for_new_server_ready(
@@ -1166,68 +1963,184 @@ Or query Log Analytics:
         desired_entry: UserCodeLauncherEntry,
         server_handle: AcaServerHandle,
         server_endpoint: ServerEndpoint,
+        timeout_seconds: float = _SERVER_READY_TIMEOUT_SECONDS,
     ) -> None:
         """
         Wait for a newly-created server to be ready to serve requests.
 
-        This polls the Container App status until it's running and healthy.
+        Concurrent waits for the same server handle share a single wait: later callers attach
+        to the in-flight one and get its outcome (including its error) instead of polling
+        again. If the wait they joined is cancelled, they fall back to waiting themselves.
         """
+        app_name = server_handle.app_name
+        state = self._readiness_state()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+
+        while True:
+            in_flight = state.ready_waits.get(server_handle)
+            if in_flight is None:
+                break
+            logger.info("Joining in-flight readiness wait for %s", app_name)
+            if not await asyncio.shield(in_flight):
+                # The shared wait was cancelled - take over with the time this caller has left
+                continue
+            if server_handle not in self._pending_pollers:
+                return
+            # This caller's own spinup started after the shared wait took its poller -
+            # wait on it too rather than leaving it behind in _pending_pollers
+            break
+
+        # Resolves to True once the server is ready, or False if this wait is cancelled
+        # (so joiners fall back to their own wait instead of being cancelled with it)
+        outcome = loop.create_future()
+        state.ready_waits[server_handle] = outcome
+        try:
+            await self._wait_until_ready(
+                server_handle, server_endpoint, max(0.0, deadline - loop.time())
+            )
+            outcome.set_result(True)
+        except asyncio.CancelledError:
+            outcome.set_result(False)
+            raise
+        except BaseException as e:
+            outcome.set_exception(e)
+            # Mark the exception retrieved so asyncio doesn't warn when nobody joined
+            outcome.exception()
+            raise
+        finally:
+            if state.ready_waits.get(server_handle) is outcome:
+                del state.ready_waits[server_handle]
+
+    async def _wait_until_ready(
+        self,
+        server_handle: AcaServerHandle,
+        server_endpoint: ServerEndpoint,
+        timeout_seconds: float,
+    ) -> None:
+        """
+        Poll a server until it's running and healthy.
+
+        This polls the Container App status until it's running and healthy. The whole
+        wait, including the provisioning operation, is bounded by timeout_seconds of
+        event-loop (monotonic) time, however slow individual ARM calls are.
+        """
+        app_name = server_handle.app_name
         logger.info(
-            f"Waiting for server to be ready: {server_handle.app_name} "
-            f"at {server_endpoint.host}:{server_endpoint.port}"
+            "Waiting for server to be ready: %s at %s:%s",
+            app_name, server_endpoint.host, server_endpoint.port
         )
 
-        max_attempts = 60  # 5 minutes with 5-second intervals
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        deadline = start_time + timeout_seconds
+
+        # Wait for the create/update operation started by _start_new_server_spinup to finish,
+        # without blocking the event loop while ARM provisions the app.
+        # The LRO's completion is ARM's own "provisioning finished" notification, and its
+        # result is a fresh ContainerApp, so it stands in for the first status poll.
+        app = None
+        poller = self._pending_pollers.pop(server_handle, None)
+        if poller is not None:
+            try:
+                app = await _await_poller(poller, timeout=max(0.0, deadline - loop.time()))
+            except asyncio.CancelledError:
+                # The operation is still running in ARM - keep its poller for the next wait
+                self._pending_pollers.setdefault(server_handle, poller)
+                raise
+            except asyncio.TimeoutError:
+                # Out of time - this wait is over, so the poller isn't kept for another one;
+                # fall through to the deadline check below
+                pass
+            else:
+                logger.info(
+                    "Provisioning operation completed: %s (readiness via LRO completion, then polling)",
+                    app_name
+                )
+        else:
+            logger.info("No pending operation for %s (readiness via polling)", app_name)
+
         attempt = 0
+        grpc_retries = 0
+        grpc_delays = _backoff_schedule()
 
-        while attempt < max_attempts:
+        while loop.time() < deadline:
+            serving = False
             try:
-                # Check Container App status
-                app = self.aca_client.container_apps.get(
-                    resource_group_name=self.resource_group,
-                    container_app_name=server_handle.app_name
-                )
+                # Check Container App status, unless the LRO result already provided it.
+                # Status comes from the shared batch poller, which paces the polls.
+                if app is None:
+                    app = await asyncio.wait_for(
+                        self._request_app_status(app_name),
+                        timeout=deadline - loop.time()
+                    )
+            except asyncio.TimeoutError:
+                break
+            except (ServiceRequestError, ServiceResponseError) as e:
+                # Transient network errors - retry on the next tick
+                logger.debug("Error checking server status (attempt %d): %s", attempt + 1, e)
+            except HttpResponseError as e:
+                # Auth and not-found errors won't fix themselves - fail fast
+                if e.status_code in (401, 403, 404):
+                    raise
+                logger.debug("Error checking server status (attempt %d): %s", attempt + 1, e)
+
+            if app is not None:
+                status = _snapshot(app)
+
+                # Terminal failures won't recover - stop polling and surface the state
+                if status.provisioning_state in _TERMINAL_PROVISIONING_STATES:
+                    raise RuntimeError(
+                        f"Server {app_name} entered terminal state "
+                        f"provisioning_state={status.provisioning_state} "
+                        f"(latest_revision={status.latest_revision_name})"
+                    )
+                if status.provisioning_state == _SUCCEEDED and status.running_status in _TERMINAL_RUNNING_STATES:
+                    raise RuntimeError(
+                        f"Server {app_name} entered terminal state "
+                        f"running_status={status.running_status} "
+                        f"(latest_revision={status.latest_revision_name})"
+                    )
 
                 # Check if app is provisioned and running
-                if (app.provisioning_state == "Succeeded" and
-                    hasattr(app, 'running_status') and
-                    app.running_status == "Running"):
+                serving = status.provisioning_state == _SUCCEEDED and status.running_status == _RUNNING
+                if serving:
 
                     # Try to connect to the gRPC server
                     try:
-                        client = server_endpoint.create_client()
+                        grpc_client = server_endpoint.create_client()
                         # Simple health check - try to list repositories
-                        await asyncio.get_event_loop().run_in_executor(
-                            None,
-                            lambda: client.health_check_query()
+                        await asyncio.wait_for(
+                            asyncio.to_thread(grpc_client.health_check_query),
+                            timeout=max(0.0, deadline - loop.time())
                         )
                         logger.info(
-                            f"Server is ready: {server_handle.app_name}"
+                            "Server is ready: %s",
+                            app_name
                         )
                         return
                     except Exception as e:
-                        logger.info(
-                            f"Server not yet responding to gRPC (attempt {attempt + 1}): {e}"
-                        )
+                        logger.debug("Server not yet responding to gRPC (attempt %d): %s", attempt + 1, e)
 
                 # Still provisioning or starting up
-                logger.info(
-                    f"Server not ready yet (attempt {attempt + 1}): "
-                    f"provisioning_state={app.provisioning_state}, "
-                    f"running_status={getattr(app, 'running_status', 'Unknown')}"
-                )
-
-            except Exception as e:
-                logger.info(
-                    f"Error checking server status (attempt {attempt + 1}): {e}"
+                logger.debug(
+                    "Server not ready yet (attempt %d): provisioning_state=%s, running_status=%s",
+                    attempt + 1, status.provisioning_state, status.running_status
                 )
 
             attempt += 1
-            await asyncio.sleep(5)
+            if serving and grpc_retries < _GRPC_RETRIES_PER_STATUS_CHECK:
+                # ARM already reports the app running - only gRPC is left to come up, so
+                # retry it directly and re-check ARM status only every few attempts
+                grpc_retries += 1
+                await asyncio.sleep(min(next(grpc_delays), max(0.0, deadline - loop.time())))
+            else:
+                grpc_retries = 0
+                app = None
 
         raise TimeoutError(
-            f"Server {server_handle.app_name} did not become ready within "
-            f"{max_attempts * 5} seconds"
+            f"Server {app_name} did not become ready within "
+            f"{timeout_seconds:.1f} seconds (elapsed {loop.time() - start_time:.1f}s, {attempt} attempts)"
         )
 
     def get_agent_id_for_server(self, handle: AcaServerHandle) -> Optional[str]:
@@ -1244,8 +2157,8 @@ Or query Log Analytics:
 
         For ACA, we return empty limits as ACA manages resources differently.
         """
-        # ACA doesn't use the same resource limit structure as ECS/K8s
-        # Return an empty CloudContainerResourceLimits
+        # ACA doesn't use the same resource limit structure as ECS/K8s. The limits are a
+        # plain dict, so each caller gets its own rather than one shared, mutable instance.
         return CloudContainerResourceLimits()
 
     def get_server_create_timestamp(self, handle: AcaServerHandle) -> Optional[float]:
@@ -1254,14 +2167,11 @@ Or query Log Analytics:
         """
         return handle.update_timestamp
 
-    @property
-    def requires_images(self) -> bool:
-        """
-        Whether this launcher requires container images.
+    # Azure Container Apps always require images
+    requires_images: ClassVar[bool] = True
 
-        Azure Container Apps always require images.
-        """
-        return True
+    # Deployment type for telemetry/reporting - DOCKER is the closest match for Container Apps
+    user_code_deployment_type: ClassVar[UserCodeDeploymentType] = UserCodeDeploymentType.DOCKER
 
     def run_launcher(self) -> AcaRunLauncher:
         """
@@ -1269,18 +2179,14 @@ Or query Log Analytics:
 
         For Dagster Cloud, runs are executed in separate containers from code servers,
         but use the same container image. The run launcher creates temporary Container Apps
-        for each run execution.
-        """
-        launcher = AcaRunLauncher()
-        launcher.register_instance(self._instance)
-        return launcher
-
-    @property
-    def user_code_deployment_type(self) -> UserCodeDeploymentType:
+        for each run execution. It holds no per-run state, so one instance is created
+        lazily and reused.
         """
-        Return the deployment type for telemetry/reporting.
-
-        We use DOCKER as the closest match for Container Apps.
-        """
-        return UserCodeDeploymentType.DOCKER
-
+        if self._run_launcher is None:
+            # Reconciler threads may ask concurrently - build exactly one
+            with self._run_launcher_lock:
+                if self._run_launcher is None:
+                    launcher = AcaRunLauncher()
+                    launcher.register_instance(self._instance)
+                    self._run_launcher = launcher
+        return self._run_launcher
@@ -5,6 +5,8 @@ and then execs the Dagster Cloud agent.
 Environment variables used:
 - KEY_VAULT_URI: set by ARM/Bicep template to vault URI, e.g. https://<vault>.vault.azure.net/
 - KEY_VAULT_SECRET_NAMES: optional comma-separated list of secret names to fetch
+- KEY_VAULT_BUNDLE_SECRET_NAME: optional name of one secret holding a JSON object of
+  ENV_VAR_NAME -> string value pairs, all set from a single fetch (named secrets override it)
 
         For each configured entry, this script will fetch the secret value and set an
         environment variable in the container. Each entry in `KEY_VAULT_SECRET_NAMES`
@@ -18,60 +20,170 @@ Environment variables used:
 """
 
 import os
+import importlib.util
+import json
+import re
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 
+# Matches ${VAR} or ${VAR:default} in dagster.yaml
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
 
-def _fetch_key_vault_secrets(vault_uri: str, secret_names: List[str]):
+
+# Key Vault clients by vault URI and their shared credential, kept for the process
+# lifetime so a later fetch reuses the pooled connections and cached token
+_SECRET_CLIENTS = {}
+_KEY_VAULT_CREDENTIAL = None
+
+# Concurrent get_secret calls, well under Key Vault's per-vault request throttling
+_KEY_VAULT_MAX_WORKERS = 16
+
+
+def _get_key_vault_credential():
+    """Return the process-wide credential for Key Vault, creating it on first use."""
+    global _KEY_VAULT_CREDENTIAL
+    if _KEY_VAULT_CREDENTIAL is None:
+        from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
+
+        # Inside Azure Container Apps (CONTAINER_APP_NAME is set by the platform) only the
+        # managed identity can work, so skip DefaultAzureCredential's probe chain
+        if os.getenv("CONTAINER_APP_NAME"):
+            _KEY_VAULT_CREDENTIAL = ManagedIdentityCredential(client_id=os.getenv("AZURE_CLIENT_ID"))
+        else:
+            _KEY_VAULT_CREDENTIAL = DefaultAzureCredential()
+    return _KEY_VAULT_CREDENTIAL
+
+
+def _make_key_vault_transport():
+    """
+    Build the HTTP transport for a Key Vault client.
+
+    requests' default pool keeps 10 connections per host, so with more concurrent fetches
+    than that the extra TLS connections to the vault would be torn down after one use.
+    """
+    import requests
+    from azure.core.pipeline.transport import RequestsTransport
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=_KEY_VAULT_MAX_WORKERS))
+    return RequestsTransport(session=session, session_owner=False)
+
+
+def _key_vault_scope(vault_uri: str) -> str:
+    """Return the token scope for a vault, e.g. https://vault.azure.net/.default for <vault>.vault.azure.net."""
+    host = urlsplit(vault_uri).hostname or ""
+    return f"https://{host.partition('.')[2] or host}/.default"
+
+
+def _parse_secret_names(secret_names_raw: str) -> List[Tuple[str, str]]:
+    """
+    Parse KEY_VAULT_SECRET_NAMES into (secret name, env var name) pairs in one pass.
+
+    Returns:
+        List of (secret name, env var name) pairs to fetch before startup
+    """
+    pairs = []
+    for entry in secret_names_raw.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+
+        # Allow mapping secretName:ENV_VAR_NAME
+        secret_name, sep, env_name = entry.partition(":")
+        secret_name = secret_name.strip()
+        pairs.append((secret_name, env_name.strip() if sep else secret_name))
+    return pairs
+
+
+def _fetch_key_vault_secrets(
+    vault_uri: str, pairs: List[Tuple[str, str]], bundle_name: Optional[str] = None
+):
     try:
-        from azure.identity import DefaultAzureCredential
         from azure.keyvault.secrets import SecretClient
+        # _get_key_vault_credential imports azure.identity itself; only check it is installed
+        if importlib.util.find_spec("azure.identity") is None:
+            raise ModuleNotFoundError("No module named 'azure.identity'")
     except Exception as e:
         logging.error("Azure SDK not available: %s", e)
         return
 
-    if not secret_names:
+    if not pairs and not bundle_name:
         logging.info("No Key Vault secret names configured.")
         return
 
-    cred = DefaultAzureCredential()
-    client = SecretClient(vault_url=vault_uri, credential=cred)
-
-    for entry in secret_names:
-        entry = entry.strip()
-        if not entry:
-            continue
-
-        # Allow mapping secretName:ENV_VAR_NAME
-        if ':' in entry:
-            secret_name, env_name = entry.split(':', 1)
-            secret_name = secret_name.strip()
-            env_name = env_name.strip()
-        else:
-            secret_name = entry
-            env_name = entry
+    client = _SECRET_CLIENTS.get(vault_uri)
+    if client is None:
+        cred = _get_key_vault_credential()
+        # Acquire the Key Vault token once up front so the concurrent fetches below all
+        # reuse the credential's cached token instead of racing to acquire their own
+        try:
+            cred.get_token(_key_vault_scope(vault_uri))
+        except Exception as e:
+            logging.warning("Pre-authentication to Key Vault failed: %s", e)
+        client = _SECRET_CLIENTS.setdefault(
+            vault_uri,
+            SecretClient(vault_url=vault_uri, credential=cred, transport=_make_key_vault_transport()),
+        )
 
+    def _fetch_one(secret_name):
+        try:
+            return client.get_secret(secret_name).value, None
+        except Exception as e:
+            return None, e
+
+    # Fetch concurrently (SecretClient is thread-safe) so startup pays roughly one
+    # round-trip instead of one per secret; the environment is then updated serially
+    secret_names = [secret_name for secret_name, _ in pairs]
+    if bundle_name:
+        secret_names.append(bundle_name)
+    with ThreadPoolExecutor(max_workers=min(_KEY_VAULT_MAX_WORKERS, len(secret_names))) as executor:
+        results = list(executor.map(_fetch_one, secret_names))
+
+    # Log one summary record rather than a line per secret from each worker
+    injected = []
+    # Apply the bundle first so individually named secrets override its entries
+    if bundle_name:
+        value, error = results.pop()
         try:
-            logging.info("Fetching secret '%s' from Key Vault -> env %s", secret_name, env_name)
-            secret = client.get_secret(secret_name)
-            os.environ[env_name] = secret.value
-            logging.info("Injected secret '%s' into environment as %s", secret_name, env_name)
+            if error is not None:
+                raise error
+            bundle = json.loads(value)
+            if not isinstance(bundle, dict):
+                raise ValueError("expected a JSON object of ENV_VAR_NAME: string value")
         except Exception as e:
-            logging.error("Failed to fetch secret '%s' from Key Vault: %s", secret_name, e)
+            logging.error("Failed to load secret bundle '%s' from Key Vault: %s", bundle_name, e)
+        else:
+            for env_name, env_value in bundle.items():
+                if not isinstance(env_value, str):
+                    logging.warning(
+                        "Skipping '%s' in secret bundle '%s': expected a string value, got %s",
+                        env_name, bundle_name, type(env_value).__name__
+                    )
+                    continue
+                os.environ[env_name] = env_value
+                injected.append(f"{bundle_name}[{env_name}] -> {env_name}")
+    for (secret_name, env_name), (value, error) in zip(pairs, results):
+        if error is not None:
+            logging.error("Failed to fetch secret '%s' from Key Vault: %s", secret_name, error)
+            continue
+        os.environ[env_name] = value
+        injected.append(f"{secret_name} -> {env_name}")
+    if injected:
+        logging.info("Injected %d secrets from Key Vault: %s", len(injected), ", ".join(injected))
 
 
 def _expand_env_vars_in_yaml():
     """Expand environment variables in dagster.yaml before Dagster reads it."""
-    import re
-
-    yaml_path = "/app/dagster.yaml"
+    yaml_path = Path("/app/dagster.yaml")
     try:
-        with open(yaml_path, 'r') as f:
-            content = f.read()
+        content = yaml_path.read_text()
 
         # Pattern to match ${VAR} or ${VAR:default}
         def replace_env_var(match):
@@ -87,11 +199,13 @@ def _expand_env_vars_in_yaml():
             return value
 
         # Replace all ${VAR} and ${VAR:default} patterns
-        expanded_content = re.sub(r'\$\{([^}]+)\}', replace_env_var, content)
+        expanded_content, count = _ENV_VAR_RE.subn(replace_env_var, content)
+        if not count:
+            logging.info("No environment variables to expand in dagster.yaml")
+            return
 
         # Write back the expanded content
-        with open(yaml_path, 'w') as f:
-            f.write(expanded_content)
+        yaml_path.write_text(expanded_content)
 
         logging.info("Successfully expanded environment variables in dagster.yaml")
     except Exception as e:
@@ -102,11 +216,15 @@ def _expand_env_vars_in_yaml():
 def main():
     vault_uri = os.getenv("KEY_VAULT_URI")
     secret_names_raw = os.getenv("KEY_VAULT_SECRET_NAMES", "")
-    secret_names = [s for s in secret_names_raw.split(",") if s]
-
-    if vault_uri and secret_names:
-        logging.info("Attempting to fetch %d secrets from Key Vault %s", len(secret_names), vault_uri)
-        _fetch_key_vault_secrets(vault_uri, secret_names)
+    secret_pairs = _parse_secret_names(secret_names_raw)
+    bundle_name = os.getenv("KEY_VAULT_BUNDLE_SECRET_NAME", "").strip() or None
+
+    if vault_uri and (secret_pairs or bundle_name):
+        logging.info(
+            "Attempting to fetch %d secrets from Key Vault %s",
+            len(secret_pairs) + bool(bundle_name), vault_uri
+        )
+        _fetch_key_vault_secrets(vault_uri, secret_pairs, bundle_name)
     else:
         logging.info("Key Vault not configured or no secrets specified (KEY_VAULT_URI or KEY_VAULT_SECRET_NAMES missing)")
 
@@ -133,34 +251,39 @@ def main():
     # The agent will read configuration from /app/dagster.yaml
     agent_cmd = ["dagster-cloud", "agent", "run"]
 
-    logging.info("=" * 60)
-    logging.info("Starting Dagster Cloud Agent with ACA Code Server Launcher")
-    logging.info("=" * 60)
-    logging.info("Configuration:")
-    logging.info("  - DAGSTER_HOME: /app")
-    logging.info("  - Config file: /app/dagster.yaml")
-    logging.info("  - Subscription: %s", os.getenv("AZURE_SUBSCRIPTION_ID", "NOT SET"))
-    logging.info("  - Agent RG: %s", os.getenv("AGENT_RESOURCE_GROUP"))
-    logging.info("  - Environment: %s", os.getenv("ENVIRONMENT_NAME", "dagster-aca-env"))
-    logging.info("  - Agent Name: %s", os.getenv("AGENT_NAME", "dagster-aca-agent"))
-    logging.info("=" * 60)
-    logging.info("Dagster Cloud Connection:")
+    # Emit the startup banner as one record so it stays contiguous and flushes once
     org_id = os.getenv("DAGSTER_CLOUD_ORG_ID", "NOT SET")
     deployment = os.getenv("DAGSTER_CLOUD_DEPLOYMENT_NAME", "NOT SET")
     token_set = "SET" if os.getenv("DAGSTER_CLOUD_API_TOKEN") else "NOT SET"
-    logging.info("  - Org ID: %s", org_id)
-    logging.info("  - Deployment: %s", deployment)
-    logging.info("  - API Token: %s", token_set)
+    rule = "=" * 60
+    lines = [
+        rule,
+        "Starting Dagster Cloud Agent with ACA Code Server Launcher",
+        rule,
+        "Configuration:",
+        "  - DAGSTER_HOME: /app",
+        "  - Config file: /app/dagster.yaml",
+        f"  - Subscription: {os.getenv('AZURE_SUBSCRIPTION_ID', 'NOT SET')}",
+        f"  - Agent RG: {os.getenv('AGENT_RESOURCE_GROUP')}",
+        f"  - Environment: {os.getenv('ENVIRONMENT_NAME', 'dagster-aca-env')}",
+        f"  - Agent Name: {os.getenv('AGENT_NAME', 'dagster-aca-agent')}",
+        rule,
+        "Dagster Cloud Connection:",
+        f"  - Org ID: {org_id}",
+        f"  - Deployment: {deployment}",
+        f"  - API Token: {token_set}",
+    ]
 
     # Construct and log the expected URL
     if org_id and org_id != "NOT SET":
         constructed_url = f"https://{org_id}.agent.dagster.cloud"
-        logging.info("  - Constructed URL: %s", constructed_url)
-        logging.info("  - GraphQL endpoint: %s/%s/graphql", constructed_url, deployment)
-    else:
-        logging.warning("  - WARNING: DAGSTER_CLOUD_ORG_ID not set! URL construction will fail!")
+        lines.append(f"  - Constructed URL: {constructed_url}")
+        lines.append(f"  - GraphQL endpoint: {constructed_url}/{deployment}/graphql")
+    lines.append(rule)
+    logging.info("\n".join(lines))
 
-    logging.info("=" * 60)
+    if not org_id or org_id == "NOT SET":
+        logging.warning("  - WARNING: DAGSTER_CLOUD_ORG_ID not set! URL construction will fail!")
 
     logging.info("Starting Dagster Cloud Agent programmatically")
 